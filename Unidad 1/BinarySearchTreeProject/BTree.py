@@ -0,0 +1,382 @@
+# Trabajo: BinarySearchTreeProject
+# Estudiante: Espinoza Felix Fausto Gabriel
+# Fecha: Octubre 18, 2026
+import mmap
+import os
+import struct
+from bisect import bisect_left
+from collections import OrderedDict
+
+PAGE_SIZE = 4096            # Tamaño de cada página del archivo (una página del sistema operativo)
+CACHE_PAGES = 256           # Páginas que se guardan decodificadas en memoria
+MAGIC = b"BTRE"             # Marca que identifica los archivos de BTree
+VERSION = 1
+
+# Página 0: marca, versión, tamaño de página, página raíz, páginas usadas y número de valores
+_HEADER = struct.Struct("<4sIIIIQ")
+# Inicio de cada página de nodo: 1 si es hoja y cantidad de valores
+_PAGE_HEADER = struct.Struct("<BxH")
+_KEY = struct.Struct("<q")
+_CHILD = struct.Struct("<I")
+
+class _Page:
+    """
+    Nodo del B-tree decodificado en memoria: sus valores ordenados y los números de página de sus hijos.
+    """
+    __slots__ = ("number", "leaf", "keys", "children", "dirty")
+
+    def __init__(self, number, leaf, keys, children):
+        self.number = number        # Número de página en el archivo
+        self.leaf = leaf            # True si no tiene hijos
+        self.keys = keys            # Valores en orden
+        self.children = children    # Páginas de los hijos (len(keys) + 1 si no es hoja)
+        self.dirty = False          # True si cambió desde que se leyó del archivo
+
+class BTree:
+    """
+    B-tree guardado en un archivo de páginas de tamaño fijo, mapeado en memoria con mmap.
+    Es el equivalente en disco de BinarySearchTree: cada nodo es una página con cientos de valores,
+    así una búsqueda entre millones de valores solo toca 3 o 4 páginas en lugar de ~20 nodos dispersos.
+    Las páginas usadas se guardan decodificadas en una caché LRU; las modificadas se escriben en el archivo
+    al salir de la caché y en flush/close. Al volver a abrir el archivo, el árbol sigue ahí.
+    Guarda enteros de 64 bits sin duplicados.
+    """
+    def __init__(self, path, cache_pages=CACHE_PAGES, page_size=PAGE_SIZE):
+        """
+        Abre el árbol guardado en path, o lo crea si el archivo no existe o está vacío.
+        Args:
+            path (str): Ruta del archivo.
+            cache_pages (int): Páginas en la caché LRU (al menos 4: un split usa 3 a la vez).
+            page_size (int): Tamaño de página de un archivo nuevo (uno existente usa el suyo).
+        Raises:
+            ValueError: Si los parámetros no son válidos o el archivo no es de BTree.
+        """
+        if cache_pages < 4:
+            raise ValueError("La caché necesita al menos 4 páginas.")
+        self.path = path
+        self.cache_pages = cache_pages
+        self.reads = 0      # Páginas leídas del archivo (fallos de caché)
+        self.writes = 0     # Páginas escritas en el archivo
+        self._cache = OrderedDict()     # Número de página -> _Page, del menos al más usado
+        self._file = open(path, "r+b" if os.path.exists(path) else "w+b")
+        if os.fstat(self._file.fileno()).st_size:
+            self._map = mmap.mmap(self._file.fileno(), 0)
+            magic, version, page_size, self._root, self._page_count, self._count = _HEADER.unpack_from(self._map, 0)
+            if magic != MAGIC or version != VERSION:
+                self._map.close()
+                self._file.close()
+                raise ValueError(f"{path} no es un archivo de BTree.")
+            self._set_page_size(page_size)
+        else:
+            self._set_page_size(page_size)
+            self._file.truncate(2 * page_size)
+            self._map = mmap.mmap(self._file.fileno(), 0)
+            self._root, self._page_count, self._count = 1, 1, 0
+            self._allocate(leaf=True)
+            self.flush()
+
+    def _set_page_size(self, page_size):
+        """
+        Calcula cuántos valores caben en una página: el grado mínimo t deja entre t - 1 y 2t - 1 valores por nodo.
+        Args:
+            page_size (int): Tamaño de página en bytes.
+        """
+        capacity = (page_size - _PAGE_HEADER.size - _CHILD.size) // (_KEY.size + _CHILD.size)
+        if page_size < _HEADER.size or capacity < 3:
+            raise ValueError(f"Página demasiado pequeña: {page_size} bytes.")
+        self.page_size = page_size
+        self.degree = (capacity + 1) // 2
+        self.max_keys = 2 * self.degree - 1
+        self._children_offset = _PAGE_HEADER.size + self.max_keys * _KEY.size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self._count
+
+    def flush(self):
+        """
+        Escribe en el archivo las páginas modificadas y la cabecera.
+        """
+        for page in self._cache.values():
+            if page.dirty:
+                self._write_page(page)
+        _HEADER.pack_into(self._map, 0, MAGIC, VERSION, self.page_size, self._root, self._page_count, self._count)
+        self._map.flush()
+
+    def close(self):
+        """
+        Guarda los cambios y cierra el archivo.
+        """
+        if self._map.closed:
+            return
+        self.flush()
+        self._map.close()
+        self._file.close()
+        self._cache.clear()
+
+    def _page(self, number):
+        """
+        Devuelve una página, desde la caché o leyéndola del archivo.
+        Si la caché se llena, sale la página usada hace más tiempo (y se escribe si cambió).
+        Args:
+            number (int): Número de página.
+        Returns:
+            _Page: La página decodificada.
+        """
+        page = self._cache.get(number)
+        if page is not None:
+            self._cache.move_to_end(number)
+            return page
+        page = self._read_page(number)
+        self._remember(page)
+        return page
+
+    def _remember(self, page):
+        """
+        Pone una página en la caché como la más reciente y descarta las más antiguas que sobren.
+        Args:
+            page (_Page): Página a guardar.
+        """
+        self._cache[page.number] = page
+        self._cache.move_to_end(page.number)
+        while len(self._cache) > self.cache_pages:
+            _, old = self._cache.popitem(last=False)
+            if old.dirty:
+                self._write_page(old)
+
+    def _mark_dirty(self, page):
+        """
+        Marca una página como modificada (se escribirá al salir de la caché o en flush).
+        Args:
+            page (_Page): Página modificada.
+        """
+        page.dirty = True
+        self._remember(page)
+
+    def _read_page(self, number):
+        """
+        Decodifica una página del archivo.
+        Args:
+            number (int): Número de página.
+        Returns:
+            _Page: La página leída.
+        """
+        self.reads += 1
+        offset = number * self.page_size
+        leaf, count = _PAGE_HEADER.unpack_from(self._map, offset)
+        keys = list(struct.unpack_from(f"<{count}q", self._map, offset + _PAGE_HEADER.size))
+        children = []
+        if not leaf:
+            children = list(struct.unpack_from(f"<{count + 1}I", self._map, offset + self._children_offset))
+        return _Page(number, bool(leaf), keys, children)
+
+    def _write_page(self, page):
+        """
+        Codifica una página en su lugar del archivo.
+        Args:
+            page (_Page): Página a escribir.
+        """
+        self.writes += 1
+        offset = page.number * self.page_size
+        count = len(page.keys)
+        _PAGE_HEADER.pack_into(self._map, offset, page.leaf, count)
+        struct.pack_into(f"<{count}q", self._map, offset + _PAGE_HEADER.size, *page.keys)
+        if not page.leaf:
+            struct.pack_into(f"<{count + 1}I", self._map, offset + self._children_offset, *page.children)
+        page.dirty = False
+
+    def _allocate(self, leaf):
+        """
+        Crea una página nueva al final del archivo, que crece al doble cuando se llena.
+        Args:
+            leaf (bool): True si la página será una hoja.
+        Returns:
+            _Page: La página nueva (ya en la caché).
+        """
+        number = self._page_count
+        self._page_count += 1
+        size = self._page_count * self.page_size
+        if size > len(self._map):
+            self._map.flush()
+            self._map.close()
+            self._file.truncate(max(size, 2 * os.fstat(self._file.fileno()).st_size))
+            self._map = mmap.mmap(self._file.fileno(), 0)
+        page = _Page(number, leaf, [], [])
+        self._mark_dirty(page)
+        return page
+
+    def insert(self, value):
+        """
+        Inserta un valor en el árbol. Al bajar, cada nodo lleno se parte en dos antes de entrar en él,
+        así la hoja final siempre tiene espacio y no hace falta volver hacia arriba.
+        No se permiten valores duplicados.
+        Args:
+            value (int): Valor a insertar (entero de 64 bits).
+        Raises:
+            ValueError: Si el valor no es un entero de 64 bits.
+        """
+        if not isinstance(value, int) or not -2 ** 63 <= value < 2 ** 63:
+            raise ValueError(f"BTree solo guarda enteros de 64 bits: {value!r}.")
+        node = self._page(self._root)
+        if len(node.keys) == self.max_keys:
+            root = self._allocate(leaf=False)
+            root.children.append(node.number)
+            self._split_child(root, 0, node)
+            self._root = root.number
+            node = root
+        while True:
+            i = bisect_left(node.keys, value)
+            if i < len(node.keys) and node.keys[i] == value:
+                return  # Si el valor es igual, no se inserta (no se permiten duplicados)
+            if node.leaf:
+                node.keys.insert(i, value)
+                self._mark_dirty(node)
+                self._count += 1
+                return
+            child = self._page(node.children[i])
+            if len(child.keys) == self.max_keys:
+                self._split_child(node, i, child)
+                if value == node.keys[i]:
+                    return
+                if value > node.keys[i]:
+                    child = self._page(node.children[i + 1])
+            node = child
+
+    def _split_child(self, parent, i, child):
+        """
+        Parte un hijo lleno en dos mitades de degree - 1 valores y sube su valor central al padre.
+        Args:
+            parent (_Page): Padre (con espacio para un valor más).
+            i (int): Posición del hijo en parent.children.
+            child (_Page): Hijo lleno.
+        """
+        t = self.degree
+        sibling = self._allocate(child.leaf)
+        sibling.keys = child.keys[t:]
+        middle = child.keys[t - 1]
+        child.keys = child.keys[:t - 1]
+        if not child.leaf:
+            sibling.children = child.children[t:]
+            child.children = child.children[:t]
+        parent.keys.insert(i, middle)
+        parent.children.insert(i + 1, sibling.number)
+        self._mark_dirty(child)
+        self._mark_dirty(parent)
+
+    def search(self, value):
+        """
+        Busca un valor bajando desde la raíz; en cada página se busca con bisección.
+        Args:
+            value (int): Valor a buscar.
+        Returns:
+            bool: True si el valor está en el árbol.
+        """
+        node = self._page(self._root)
+        while True:
+            i = bisect_left(node.keys, value)
+            if i < len(node.keys) and node.keys[i] == value:
+                return True
+            if node.leaf:
+                return False
+            node = self._page(node.children[i])
+
+    def contains(self, value):
+        """
+        Indica si un valor está en el árbol (también se puede escribir valor in arbol).
+        Args:
+            value (int): Valor a buscar.
+        Returns:
+            bool: True si el valor está en el árbol.
+        """
+        return self.search(value)
+
+    __contains__ = contains
+
+    def height(self):
+        """
+        Devuelve la altura del árbol (todas las hojas están al mismo nivel).
+        Returns:
+            int: Número de niveles del árbol.
+        """
+        levels = 1
+        node = self._page(self._root)
+        while not node.leaf:
+            node = self._page(node.children[0])
+            levels += 1
+        return levels
+
+    def range(self, low=None, high=None):
+        """
+        Recorre en orden los valores entre low y high (ambos incluidos; None es sin límite) de forma perezosa.
+        Baja una vez hasta low y luego avanza página por página con una pila de (página, posición).
+        Args:
+            low (int): Límite inferior.
+            high (int): Límite superior.
+        """
+        stack = []      # (página interna, posición del próximo valor a entregar)
+        number = self._root
+        while True:
+            while True:
+                node = self._page(number)
+                i = 0 if low is None else bisect_left(node.keys, low)
+                if node.leaf:
+                    break
+                stack.append((number, i))
+                number = node.children[i]
+            low = None      # Después del primer descenso, cada subárbol se recorre desde su inicio
+            for key in node.keys[i:]:
+                if high is not None and key > high:
+                    return
+                yield key
+            while stack:
+                number, i = stack.pop()
+                node = self._page(number)
+                if i < len(node.keys):
+                    key = node.keys[i]
+                    if high is not None and key > high:
+                        return
+                    yield key
+                    stack.append((number, i + 1))
+                    number = node.children[i + 1]
+                    break
+            else:
+                return
+
+    def __iter__(self):
+        """
+        Recorre todos los valores en orden (de menor a mayor) de forma perezosa.
+        """
+        return self.range()
+
+    def print_tree(self):
+        """
+        Imprime el árbol en orden (in-order), mostrando los valores de menor a mayor.
+        """
+        for value in self:
+            print(value, end=' ')
+        print()
+
+if __name__ == "__main__":
+    import tempfile
+
+    # Ejemplo de uso del B-tree en disco
+    path = os.path.join(tempfile.mkdtemp(), "ejemplo.btree")
+    with BTree(path) as tree:
+        for val in [50, 30, 70, 20, 40, 60, 80]:
+            tree.insert(val)
+        print("Recorrido in-order del B-tree:")
+        tree.print_tree()
+        for val in range(1000, 201000):
+            tree.insert(val)
+        print("Valores:", len(tree), "- Altura:", tree.height(), "- Páginas leídas del archivo:", tree.reads)
+
+    # Al volver a abrir el archivo los valores siguen ahí
+    with BTree(path) as tree:
+        print("Tras reabrir: ¿está el 150000?", tree.search(150000), "- Valores entre 40 y 1003:",
+              list(tree.range(40, 1003)), "- Páginas leídas:", tree.reads)
+    os.remove(path)
@@ -1,57 +1,370 @@
 # Trabajo: BinarySearchTreeProject
 # Estudiante: Espinoza Felix Fausto Gabriel
 # Fecha: Septiembre 08, 2025
+from array import array
+from itertools import islice
 
 class Node:
     """
     Clase que representa un nodo en el Árbol de Búsqueda Binaria (BST).
-    Cada nodo contiene un valor y referencias a sus hijos izquierdo y derecho.
+    Cada nodo contiene un valor, referencias a sus hijos izquierdo y derecho y el tamaño de su subárbol.
+    Usa __slots__: sin __dict__ por nodo, cada uno ocupa varias veces menos memoria.
     """
+    __slots__ = ("value", "left", "right", "size")
+
     def __init__(self, value):
         self.value = value  # Valor almacenado en el nodo
         self.left = None    # Hijo izquierdo
         self.right = None   # Hijo derecho
+        self.size = 1       # Número de nodos del subárbol con raíz en este nodo
 
 class BinarySearchTree:
     """
     Clase que representa el Árbol de Búsqueda Binaria (BST).
-    Permite insertar valores y mostrar el árbol en orden.
+    Permite insertar, buscar y borrar valores, recorrer el árbol en orden y mostrarlo.
+    Cada nodo guarda el tamaño de su subárbol, así rank y select cuestan lo mismo que una búsqueda.
+    Todos los recorridos son iterativos, así un árbol muy profundo no agota el límite de recursión.
     """
+    node_class = Node   # Clase de los nodos que crea el árbol
+
     def __init__(self):
         self.root = None  # Nodo raíz del árbol
 
+    @classmethod
+    def from_iterable(cls, values):
+        """
+        Construye un árbol perfectamente balanceado con todos los valores de una vez.
+        Si los valores ya vienen ordenados, la construcción es O(n); si no, se ordenan una sola vez (O(n log n)).
+        Los duplicados se descartan, igual que en insert.
+        Args:
+            values (iterable): Valores a cargar.
+        Returns:
+            BinarySearchTree: Árbol nuevo de la misma clase (un AVLTree.from_iterable devuelve un AVLTree).
+        """
+        values = list(values)
+        if any(later < earlier for earlier, later in zip(values, islice(values, 1, None))):
+            values.sort()
+        unique = [value for i, value in enumerate(values) if i == 0 or values[i - 1] < value]
+        tree = cls()
+        tree.root = tree._build_balanced(unique, 0, len(unique))
+        return tree
+
+    def _build_balanced(self, values, low, high):
+        """
+        Método auxiliar que cuelga el valor central de values[low:high] como raíz y repite en cada mitad.
+        Cada valor se visita una vez (O(n)) y la recursión solo tiene O(log n) niveles.
+        Args:
+            values (list): Valores ordenados y sin repetir.
+            low (int): Inicio del tramo (incluido).
+            high (int): Fin del tramo (excluido).
+        Returns:
+            Node: Raíz del subárbol (None si el tramo está vacío).
+        """
+        if low >= high:
+            return None
+        middle = (low + high) // 2
+        node = self.node_class(values[middle])
+        node.left = self._build_balanced(values, low, middle)
+        node.right = self._build_balanced(values, middle + 1, high)
+        self._update(node)
+        return node
+
+    def _update(self, node):
+        """
+        Recalcula los datos de un nodo que dependen de sus hijos (el tamaño de su subárbol).
+        Args:
+            node (Node): Nodo a actualizar.
+        """
+        node.size = 1 + self._size(node.left) + self._size(node.right)
+
+    @staticmethod
+    def _size(node):
+        """
+        Tamaño de un subárbol (0 para un subárbol vacío).
+        Args:
+            node (Node): Raíz del subárbol.
+        """
+        return node.size if node else 0
+
+    def __len__(self):
+        return self._size(self.root)
+
     def insert(self, value):
         """
         Inserta un nuevo nodo con el valor dado en el BST.
         Si el árbol está vacío, el nuevo nodo se convierte en la raíz.
-        Si no, se busca la posición correcta de forma recursiva.
+        Si no, se baja desde la raíz con un ciclo hasta el hueco donde corresponde el valor,
+        guardando el camino para actualizar después los tamaños de los subárboles.
         No se permiten valores duplicados.
         Args:
             value (int): Valor a insertar en el árbol.
         """
-        if self.root is None:
-            self.root = Node(value)
+        path = []
+        current = self.root
+        while current is not None:
+            path.append(current)
+            if value < current.value:
+                current = current.left
+            elif value > current.value:
+                current = current.right
+            else:
+                return  # Si el valor es igual, no se inserta (no se permiten duplicados)
+        node = self.node_class(value)
+        if not path:
+            self.root = node
+        elif value < path[-1].value:
+            path[-1].left = node
+        else:
+            path[-1].right = node
+        self._repair_path(path)
+
+    def delete(self, value):
+        """
+        Borra un valor del árbol. Un nodo con dos hijos toma el valor de su sucesor (el menor de su
+        subárbol derecho) y se borra el sucesor, que tiene a lo más un hijo.
+        Args:
+            value (int): Valor a borrar.
+        Returns:
+            bool: True si el valor estaba en el árbol.
+        """
+        path = []
+        current = self.root
+        while current is not None and (value < current.value or value > current.value):
+            path.append(current)
+            current = current.left if value < current.value else current.right
+        if current is None:
+            return False
+        if current.left is not None and current.right is not None:
+            path.append(current)
+            successor = current.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            current.value = successor.value
+            current = successor
+        child = current.left if current.left is not None else current.right
+        self._replace_child(path[-1] if path else None, current, child)
+        self._repair_path(path)
+        return True
+
+    def _replace_child(self, parent, old, new):
+        """
+        Cuelga new en el lugar que ocupaba old bajo parent (o como raíz si parent es None).
+        Args:
+            parent (Node): Padre de old.
+            old (Node): Hijo a reemplazar.
+            new (Node): Nuevo hijo (puede ser None).
+        """
+        if parent is None:
+            self.root = new
+        elif parent.left is old:
+            parent.left = new
         else:
-            self._insert_recursive(self.root, value)
+            parent.right = new
+
+    def _repair_path(self, path):
+        """
+        Actualiza los nodos de un camino, del más profundo a la raíz, tras insertar o borrar debajo de ellos.
+        Args:
+            path (list): Nodos desde la raíz hacia abajo.
+        """
+        for node in reversed(path):
+            self._update(node)
+
+    def search(self, value):
+        """
+        Busca un valor bajando desde la raíz con un ciclo.
+        Args:
+            value (int): Valor a buscar.
+        Returns:
+            bool: True si el valor está en el árbol.
+        """
+        current = self.root
+        while current is not None:
+            if value < current.value:
+                current = current.left
+            elif value > current.value:
+                current = current.right
+            else:
+                return True
+        return False
+
+    def contains(self, value):
+        """
+        Indica si un valor está en el árbol (también se puede escribir valor in arbol).
+        Args:
+            value (int): Valor a buscar.
+        Returns:
+            bool: True si el valor está en el árbol.
+        """
+        return self.search(value)
+
+    __contains__ = contains
+
+    def min(self):
+        """
+        Devuelve el menor valor del árbol.
+        Raises:
+            ValueError: Si el árbol está vacío.
+        """
+        if self.root is None:
+            raise ValueError("El árbol está vacío.")
+        current = self.root
+        while current.left is not None:
+            current = current.left
+        return current.value
+
+    def max(self):
+        """
+        Devuelve el mayor valor del árbol.
+        Raises:
+            ValueError: Si el árbol está vacío.
+        """
+        if self.root is None:
+            raise ValueError("El árbol está vacío.")
+        current = self.root
+        while current.right is not None:
+            current = current.right
+        return current.value
+
+    def floor(self, value):
+        """
+        Devuelve el mayor valor del árbol que es menor o igual que value.
+        Args:
+            value (int): Valor de referencia.
+        Returns:
+            int: El valor encontrado, o None si todos son mayores.
+        """
+        result = None
+        current = self.root
+        while current is not None:
+            if value < current.value:
+                current = current.left
+            elif value > current.value:
+                result = current.value
+                current = current.right
+            else:
+                return current.value
+        return result
 
-    def _insert_recursive(self, current, value):
+    def ceiling(self, value):
         """
-        Método auxiliar recursivo para insertar un valor en el árbol.
+        Devuelve el menor valor del árbol que es mayor o igual que value.
         Args:
-            current (Node): Nodo actual en el recorrido.
-            value (int): Valor a insertar.
+            value (int): Valor de referencia.
+        Returns:
+            int: El valor encontrado, o None si todos son menores.
         """
-        if value < current.value:
-            if current.left is None:
-                current.left = Node(value)
+        result = None
+        current = self.root
+        while current is not None:
+            if value > current.value:
+                current = current.right
+            elif value < current.value:
+                result = current.value
+                current = current.left
             else:
-                self._insert_recursive(current.left, value)
-        elif value > current.value:
-            if current.right is None:
-                current.right = Node(value)
+                return current.value
+        return result
+
+    def rank(self, value):
+        """
+        Cuenta los valores del árbol menores que value (su posición si estuviera en el árbol).
+        Usa los tamaños de los subárboles: O(altura).
+        Args:
+            value (int): Valor de referencia.
+        Returns:
+            int: Número de valores menores que value.
+        """
+        rank = 0
+        current = self.root
+        while current is not None:
+            if value < current.value:
+                current = current.left
+            elif value > current.value:
+                rank += 1 + self._size(current.left)
+                current = current.right
+            else:
+                return rank + self._size(current.left)
+        return rank
+
+    def select(self, k):
+        """
+        Devuelve el k-ésimo menor valor (k = 0 es el mínimo). Usa los tamaños de los subárboles: O(altura).
+        Args:
+            k (int): Posición en orden, de 0 a len(arbol) - 1.
+        Raises:
+            IndexError: Si k está fuera de rango.
+        """
+        if not 0 <= k < len(self):
+            raise IndexError(f"Posición fuera de rango: {k}.")
+        current = self.root
+        while True:
+            left = self._size(current.left)
+            if k < left:
+                current = current.left
+            elif k > left:
+                k -= left + 1
+                current = current.right
             else:
-                self._insert_recursive(current.right, value)
-        # Si el valor es igual, no se inserta (no se permiten duplicados)
+                return current.value
+
+    def range(self, low, high):
+        """
+        Recorre en orden los valores entre low y high (ambos incluidos) de forma perezosa.
+        Solo visita los nodos del rango y el camino hasta ellos: O(altura + resultados).
+        Args:
+            low (int): Límite inferior.
+            high (int): Límite superior.
+        """
+        stack = []
+        current = self.root
+        while True:
+            while current is not None:
+                if current.value < low:
+                    current = current.right     # Todo su subárbol izquierdo también es menor que low
+                else:
+                    stack.append(current)
+                    current = current.left
+            if not stack:
+                return
+            current = stack.pop()
+            if current.value > high:
+                return
+            yield current.value
+            current = current.right
+
+    def __iter__(self):
+        """
+        Recorre los valores en orden (de menor a mayor) de forma perezosa.
+        Usa una pila explícita con a lo más un nodo por nivel: la memoria es O(altura), no O(n).
+        """
+        for node in self._iter_nodes(self.root):
+            yield node.value
+
+    def __reversed__(self):
+        """
+        Recorre los valores de mayor a menor, igual que __iter__ pero en espejo.
+        """
+        for node in self._iter_nodes(self.root, reverse=True):
+            yield node.value
+
+    @staticmethod
+    def _iter_nodes(node, reverse=False):
+        """
+        Generador del recorrido in-order de un subárbol con una pila explícita.
+        Args:
+            node (Node): Raíz del subárbol.
+            reverse (bool): Si es True, recorre de mayor a menor.
+        """
+        stack = []
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.right if reverse else node.left
+            node = stack.pop()
+            yield node
+            node = node.left if reverse else node.right
 
     def print_tree(self):
         """
@@ -63,14 +376,533 @@ class BinarySearchTree:
 
     def _print_in_order(self, node):
         """
-        Método auxiliar para imprimir el árbol en orden.
+        Método auxiliar para imprimir un subárbol en orden (sin recursión).
+        Args:
+            node (Node): Raíz del subárbol.
+        """
+        for current in self._iter_nodes(node):
+            print(current.value, end=' ')
+
+class AVLNode(Node):
+    """
+    Nodo del árbol AVL.
+    Además del valor y los hijos guarda la altura de su subárbol.
+    """
+    __slots__ = ("height",)
+
+    def __init__(self, value):
+        super().__init__(value)
+        self.height = 1     # Altura del subárbol con raíz en este nodo (una hoja mide 1)
+
+class AVLTree(BinarySearchTree):
+    """
+    Árbol AVL: Árbol de Búsqueda Binaria que se rebalancea en cada inserción y cada borrado.
+    En cada nodo las alturas de los subárboles izquierdo y derecho difieren a lo más en 1,
+    así la altura es O(log n) aunque los valores lleguen ordenados.
+    Tiene la misma interfaz que BinarySearchTree.
+    """
+    node_class = AVLNode
+
+    def _repair_path(self, path):
+        """
+        Rebalancea los nodos de un camino desde el más profundo hasta la raíz,
+        colgando cada subárbol rotado del padre que le corresponde.
+        insert y delete son los de BinarySearchTree: guardan el camino al bajar y lo reparan aquí.
+        Args:
+            path (list): Nodos desde la raíz hacia abajo.
+        """
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            subtree = self._rebalance(node)
+            if subtree is not node:
+                self._replace_child(path[i - 1] if i else None, node, subtree)
+
+    def height(self):
+        """
+        Devuelve la altura del árbol (0 si está vacío).
+        Returns:
+            int: Número de niveles del árbol.
+        """
+        return self._height(self.root)
+
+    @staticmethod
+    def _height(node):
+        """
+        Altura de un subárbol (0 para un subárbol vacío).
+        Args:
+            node (AVLNode): Raíz del subárbol.
+        """
+        return node.height if node else 0
+
+    def _update(self, node):
+        """
+        Recalcula el tamaño y la altura de un nodo a partir de los de sus hijos.
+        Args:
+            node (AVLNode): Nodo a actualizar.
+        """
+        super()._update(node)
+        node.height = 1 + max(self._height(node.left), self._height(node.right))
+
+    def _rebalance(self, node):
+        """
+        Actualiza la altura de un nodo y, si sus subárboles difieren en más de 1, lo rota.
+        Los casos izquierda-derecha y derecha-izquierda necesitan una rotación previa del hijo.
+        Args:
+            node (AVLNode): Nodo cuyos hijos ya están balanceados.
+        Returns:
+            AVLNode: Nueva raíz del subárbol.
+        """
+        self._update(node)
+        balance = self._height(node.left) - self._height(node.right)
+        if balance > 1:
+            if self._height(node.left.left) < self._height(node.left.right):
+                node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+        if balance < -1:
+            if self._height(node.right.right) < self._height(node.right.left):
+                node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
+        return node
+
+    def _rotate_left(self, node):
+        """
+        Rotación a la izquierda: el hijo derecho sube y node pasa a ser su hijo izquierdo.
+        Args:
+            node (AVLNode): Raíz del subárbol a rotar.
+        Returns:
+            AVLNode: Nueva raíz del subárbol.
+        """
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+    def _rotate_right(self, node):
+        """
+        Rotación a la derecha: el hijo izquierdo sube y node pasa a ser su hijo derecho.
+        Args:
+            node (AVLNode): Raíz del subárbol a rotar.
+        Returns:
+            AVLNode: Nueva raíz del subárbol.
+        """
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+NIL = -1    # Índice de "sin hijo" en CompactBinarySearchTree
+
+class CompactBinarySearchTree:
+    """
+    Árbol de Búsqueda Binaria guardado en columnas de array en lugar de objetos Node.
+    El nodo i tiene su valor en keys[i], los índices de sus hijos en left[i] y right[i] (NIL si no hay)
+    y el tamaño de su subárbol en size[i].
+    Con valores enteros cada nodo ocupa 20 bytes (8 del valor y 4 por hijo y por tamaño), frente a unos 92 de
+    un Node con __slots__ más su entero, y los nodos quedan contiguos en memoria. Las casillas de los nodos
+    borrados forman una lista libre (encadenada por left) que se reutiliza en las siguientes inserciones.
+    Tiene la misma interfaz que BinarySearchTree; los valores deben caber en el tipo del typecode.
+    """
+    def __init__(self, typecode="q"):
+        """
+        Args:
+            typecode (str): Tipo de array de los valores ("q": enteros de 64 bits, "d": flotantes).
+        """
+        self.keys = array(typecode)     # Valor de cada nodo
+        self.left = array("i")          # Índice del hijo izquierdo de cada nodo
+        self.right = array("i")         # Índice del hijo derecho de cada nodo
+        self.size = array("i")          # Tamaño del subárbol de cada nodo
+        self.root = NIL                 # Índice de la raíz
+        self._free = NIL                # Primera casilla libre (NIL si no hay)
+        self._count = 0                 # Número de valores guardados
+
+    @classmethod
+    def from_iterable(cls, values, typecode="q"):
+        """
+        Construye un árbol perfectamente balanceado con todos los valores de una vez, igual que
+        BinarySearchTree.from_iterable. Los valores quedan en keys en orden, así recorrerlos es secuencial.
+        Args:
+            values (iterable): Valores a cargar.
+            typecode (str): Tipo de array de los valores.
+        Returns:
+            CompactBinarySearchTree: Árbol nuevo.
+        """
+        values = list(values)
+        if any(later < earlier for earlier, later in zip(values, islice(values, 1, None))):
+            values.sort()
+        tree = cls(typecode)
+        tree.keys.extend(value for i, value in enumerate(values) if i == 0 or values[i - 1] < value)
+        n = tree._count = len(tree.keys)
+        tree.left = array("i", [NIL]) * n
+        tree.right = array("i", [NIL]) * n
+        tree.size = array("i", [1]) * n
+        tree.root = tree._link_balanced(0, n)
+        return tree
+
+    def _link_balanced(self, low, high):
+        """
+        Enlaza los nodos low..high-1 (ya ordenados) como un árbol balanceado: el central es la raíz
+        de cada tramo y su subárbol tiene todo el tramo. Usa una pila de tramos en lugar de recursión.
+        Args:
+            low (int): Inicio del tramo (incluido).
+            high (int): Fin del tramo (excluido).
+        Returns:
+            int: Índice de la raíz (NIL si el tramo está vacío).
+        """
+        if low >= high:
+            return NIL
+        root = (low + high) // 2
+        stack = [(low, high)]
+        while stack:
+            low, high = stack.pop()
+            middle = (low + high) // 2
+            self.size[middle] = high - low
+            if low < middle:
+                self.left[middle] = (low + middle) // 2
+                stack.append((low, middle))
+            if middle + 1 < high:
+                self.right[middle] = (middle + 1 + high) // 2
+                stack.append((middle + 1, high))
+        return root
+
+    def __len__(self):
+        return self._count
+
+    def _allocate(self, value):
+        """
+        Reserva una casilla para un nodo nuevo: la primera de la lista libre o una al final de las columnas.
+        Args:
+            value (int): Valor del nodo.
+        Returns:
+            int: Índice del nodo.
+        """
+        self._count += 1
+        index = self._free
+        if index == NIL:
+            self.keys.append(value)
+            self.left.append(NIL)
+            self.right.append(NIL)
+            self.size.append(1)
+            return len(self.keys) - 1
+        self._free = self.left[index]
+        self.keys[index] = value
+        self.left[index] = self.right[index] = NIL
+        self.size[index] = 1
+        return index
+
+    def _release(self, index):
+        """
+        Devuelve la casilla de un nodo borrado a la lista libre.
+        Args:
+            index (int): Índice del nodo.
+        """
+        self._count -= 1
+        self.left[index] = self._free
+        self._free = index
+
+    def insert(self, value):
+        """
+        Inserta un valor bajando desde la raíz con un ciclo. No se permiten valores duplicados.
+        Args:
+            value (int): Valor a insertar en el árbol.
+        """
+        index, path = self._find(value)
+        if index != NIL:
+            return  # Si el valor es igual, no se inserta (no se permiten duplicados)
+        index = self._allocate(value)
+        if not path:
+            self.root = index
+        elif value < self.keys[path[-1]]:
+            self.left[path[-1]] = index
+        else:
+            self.right[path[-1]] = index
+        for node in path:
+            self.size[node] += 1
+
+    def search(self, value):
+        """
+        Busca un valor bajando desde la raíz con un ciclo.
+        Args:
+            value (int): Valor a buscar.
+        Returns:
+            bool: True si el valor está en el árbol.
+        """
+        keys, left, right = self.keys, self.left, self.right
+        current = self.root
+        while current != NIL:
+            key = keys[current]
+            if value < key:
+                current = left[current]
+            elif value > key:
+                current = right[current]
+            else:
+                return True
+        return False
+
+    def _find(self, value):
+        """
+        Busca el nodo de un valor guardando el camino desde la raíz.
+        Args:
+            value (int): Valor a buscar.
+        Returns:
+            tuple: (índice del nodo, índices de sus ancestros desde la raíz); el nodo es NIL si el valor
+            no está, y entonces el último del camino es el padre que tendría.
+        """
+        keys, left, right = self.keys, self.left, self.right
+        path = []
+        current = self.root
+        while current != NIL:
+            key = keys[current]
+            if value < key:
+                path.append(current)
+                current = left[current]
+            elif value > key:
+                path.append(current)
+                current = right[current]
+            else:
+                break
+        return current, path
+
+    def delete(self, value):
+        """
+        Borra un valor del árbol. Un nodo con dos hijos toma el valor de su sucesor (el menor de su
+        subárbol derecho) y se borra el sucesor, que tiene a lo más un hijo.
+        Args:
+            value (int): Valor a borrar.
+        Returns:
+            bool: True si el valor estaba en el árbol.
+        """
+        left, right = self.left, self.right
+        index, path = self._find(value)
+        if index == NIL:
+            return False
+        if left[index] != NIL and right[index] != NIL:
+            path.append(index)
+            successor = right[index]
+            while left[successor] != NIL:
+                path.append(successor)
+                successor = left[successor]
+            self.keys[index] = self.keys[successor]
+            index = successor
+        child = left[index] if left[index] != NIL else right[index]
+        parent = path[-1] if path else NIL
+        for node in path:
+            self.size[node] -= 1
+        if parent == NIL:
+            self.root = child
+        elif left[parent] == index:
+            left[parent] = child
+        else:
+            right[parent] = child
+        self._release(index)
+        return True
+
+    def contains(self, value):
+        """
+        Indica si un valor está en el árbol (también se puede escribir valor in arbol).
+        Args:
+            value (int): Valor a buscar.
+        Returns:
+            bool: True si el valor está en el árbol.
+        """
+        return self.search(value)
+
+    __contains__ = contains
+
+    def min(self):
+        """
+        Devuelve el menor valor del árbol.
+        Raises:
+            ValueError: Si el árbol está vacío.
+        """
+        return self.keys[self._extreme(self.left)]
+
+    def max(self):
+        """
+        Devuelve el mayor valor del árbol.
+        Raises:
+            ValueError: Si el árbol está vacío.
+        """
+        return self.keys[self._extreme(self.right)]
+
+    def _extreme(self, children):
+        """
+        Baja desde la raíz siempre por el mismo lado.
+        Args:
+            children (array): Columna left (mínimo) o right (máximo).
+        Returns:
+            int: Índice del último nodo del camino.
+        """
+        if self.root == NIL:
+            raise ValueError("El árbol está vacío.")
+        current = self.root
+        while children[current] != NIL:
+            current = children[current]
+        return current
+
+    def floor(self, value):
+        """
+        Devuelve el mayor valor del árbol que es menor o igual que value.
+        Args:
+            value (int): Valor de referencia.
+        Returns:
+            int: El valor encontrado, o None si todos son mayores.
+        """
+        keys, left, right = self.keys, self.left, self.right
+        result = None
+        current = self.root
+        while current != NIL:
+            key = keys[current]
+            if value < key:
+                current = left[current]
+            elif value > key:
+                result = key
+                current = right[current]
+            else:
+                return key
+        return result
+
+    def ceiling(self, value):
+        """
+        Devuelve el menor valor del árbol que es mayor o igual que value.
+        Args:
+            value (int): Valor de referencia.
+        Returns:
+            int: El valor encontrado, o None si todos son menores.
+        """
+        keys, left, right = self.keys, self.left, self.right
+        result = None
+        current = self.root
+        while current != NIL:
+            key = keys[current]
+            if value > key:
+                current = right[current]
+            elif value < key:
+                result = key
+                current = left[current]
+            else:
+                return key
+        return result
+
+    def _subtree_size(self, index):
+        """
+        Tamaño de un subárbol (0 para NIL).
+        Args:
+            index (int): Raíz del subárbol.
+        """
+        return self.size[index] if index != NIL else 0
+
+    def rank(self, value):
+        """
+        Cuenta los valores del árbol menores que value. Usa la columna size: O(altura).
+        Args:
+            value (int): Valor de referencia.
+        Returns:
+            int: Número de valores menores que value.
+        """
+        keys, left, right = self.keys, self.left, self.right
+        rank = 0
+        current = self.root
+        while current != NIL:
+            key = keys[current]
+            if value < key:
+                current = left[current]
+            elif value > key:
+                rank += 1 + self._subtree_size(left[current])
+                current = right[current]
+            else:
+                return rank + self._subtree_size(left[current])
+        return rank
+
+    def select(self, k):
+        """
+        Devuelve el k-ésimo menor valor (k = 0 es el mínimo). Usa la columna size: O(altura).
+        Args:
+            k (int): Posición en orden, de 0 a len(arbol) - 1.
+        Raises:
+            IndexError: Si k está fuera de rango.
+        """
+        if not 0 <= k < len(self):
+            raise IndexError(f"Posición fuera de rango: {k}.")
+        current = self.root
+        while True:
+            left = self._subtree_size(self.left[current])
+            if k < left:
+                current = self.left[current]
+            elif k > left:
+                k -= left + 1
+                current = self.right[current]
+            else:
+                return self.keys[current]
+
+    def range(self, low, high):
+        """
+        Recorre en orden los valores entre low y high (ambos incluidos) de forma perezosa.
+        Args:
+            low (int): Límite inferior.
+            high (int): Límite superior.
+        """
+        keys, left, right = self.keys, self.left, self.right
+        stack = []
+        current = self.root
+        while True:
+            while current != NIL:
+                if keys[current] < low:
+                    current = right[current]    # Todo su subárbol izquierdo también es menor que low
+                else:
+                    stack.append(current)
+                    current = left[current]
+            if not stack:
+                return
+            current = stack.pop()
+            if keys[current] > high:
+                return
+            yield keys[current]
+            current = right[current]
+
+    def __iter__(self):
+        """
+        Recorre los valores en orden (de menor a mayor) de forma perezosa, con una pila de índices.
+        """
+        keys = self.keys
+        for index in self._iter_indices(self.root):
+            yield keys[index]
+
+    def __reversed__(self):
+        """
+        Recorre los valores de mayor a menor.
+        """
+        keys = self.keys
+        for index in self._iter_indices(self.root, reverse=True):
+            yield keys[index]
+
+    def _iter_indices(self, index, reverse=False):
+        """
+        Generador del recorrido in-order de un subárbol con una pila explícita de índices.
         Args:
-            node (Node): Nodo actual en el recorrido.
+            index (int): Raíz del subárbol.
+            reverse (bool): Si es True, recorre de mayor a menor.
+        """
+        first, second = (self.right, self.left) if reverse else (self.left, self.right)
+        stack = []
+        while stack or index != NIL:
+            while index != NIL:
+                stack.append(index)
+                index = first[index]
+            index = stack.pop()
+            yield index
+            index = second[index]
+
+    def print_tree(self):
         """
-        if node:
-            self._print_in_order(node.left)
-            print(node.value, end=' ')
-            self._print_in_order(node.right)
+        Imprime el árbol en orden (in-order), mostrando los valores de menor a mayor.
+        """
+        for value in self:
+            print(value, end=' ')
+        print()
 
 if __name__ == "__main__":
     # Ejemplo de uso del Árbol de Búsqueda Binaria
@@ -82,3 +914,25 @@ if __name__ == "__main__":
         bst.insert(val)
     print("Recorrido in-order del BST:")
     bst.print_tree()
+    print("Recorrido de mayor a menor:", list(reversed(bst)))
+    print("¿Está el 40?", bst.search(40), "- ¿Está el 45?", bst.search(45))
+
+    # Con valores ordenados el BST se degenera en una lista; el AVL mantiene altura logarítmica
+    avl = AVLTree()
+    for val in range(1, 10001):
+        avl.insert(val)
+    print("Altura del AVL con 10000 valores insertados en orden:", avl.height())
+
+    # Carga masiva: un árbol balanceado en O(n) a partir de valores ordenados
+    loaded = AVLTree.from_iterable(range(1, 100001))
+    print("Altura del AVL cargado con from_iterable (100000 valores):", loaded.height())
+
+    # Versión compacta: los nodos viven en columnas de array y se pueden borrar
+    compact = CompactBinarySearchTree.from_iterable(sample_values)
+    compact.delete(50)
+    compact.insert(55)
+    print("Árbol compacto tras borrar 50 e insertar 55:", list(compact))
+
+    # Estadísticas de orden con los tamaños de los subárboles
+    print("Mediana:", loaded.select(len(loaded) // 2), "- Valores menores que 2500:", loaded.rank(2500))
+    print("Valores entre 99995 y 100010:", list(loaded.range(99995, 100010)))
@@ -0,0 +1,147 @@
+# Solucionador por lotes sin interfaz gráfica: lee tableros y los resuelve en paralelo.
+# Autor: Espinoza Felix Fausto Gabriel.
+# Fecha: 2026-10-18.
+#
+# Uso: py batch.py tableros.txt --method ida_star --heuristic pdb --workers 8 > resultados.jsonl
+#
+# Cada línea de entrada es un tablero con sus valores separados por espacios o comas (0 es el blanco);
+# las líneas vacías y las que empiezan con # se ignoran. Sin archivo (o con -) se lee la entrada estándar.
+# Cada resultado es una línea JSON con la longitud del camino y las estadísticas de SolverStats; el resumen (tableros por segundo) se escribe en la salida de errores.
+# Con varios procesos los resultados salen en cuanto se resuelven (no en el orden de entrada); "line" indica a qué
+# línea corresponde cada uno. Cada línea se escribe y se vacía al momento, así no se pierde lo ya resuelto.
+# No importa tkinter, así arranca rápido en servidores.
+import argparse
+import json
+import multiprocessing
+import sys
+import time
+
+from heuristics import HEURISTICS, make_heuristic
+from model import SOLVERS, SolutionCache, SolverStats, board_width
+
+# Métodos disponibles: los de model.py más la tabla perfecta del puzzle 8.
+METHODS = sorted(SOLVERS) + ["table"]
+HEURISTIC_METHODS = ("a_star", "ida_star", "anytime")   # Métodos que aceptan una heurística (Manhattan va en línea).
+CACHE_METHODS = ("a_star", "ida_star")       # Métodos que aceptan una caché de soluciones.
+
+_worker = {}    # Configuración de cada proceso trabajador.
+
+# Prepara un proceso trabajador con el método y la heurística elegidos.
+def _init_worker(method, heuristic, include_path, track_memory, cache_size, budget, goal=None):
+    _worker["method"] = method
+    _worker["heuristic"] = heuristic
+    _worker["include_path"] = include_path
+    _worker["track_memory"] = track_memory
+    _worker["cache_size"] = cache_size
+    _worker["budget"] = budget    # time_limit y node_limit de anytime.
+    _worker["goal"] = goal        # Objetivo propio de todos los tableros (None: el estándar).
+    _worker["heuristics"] = {}    # Heurísticas ya creadas por ancho de tablero.
+    _worker["caches"] = {}        # Cachés de soluciones por ancho de tablero.
+
+# Convierte una línea de texto en un tablero.
+def parse_board(line):
+    return [int(value) for value in line.replace(",", " ").split()]
+
+# Devuelve la heurística del trabajador para un ancho de tablero (creada una sola vez por proceso; una PDB se mapea una vez).
+def _heuristic_for(width):
+    heuristics = _worker["heuristics"]
+    if width not in heuristics:
+        heuristics[width] = make_heuristic(_worker["heuristic"], width, _worker["goal"])
+    return heuristics[width]
+
+# Devuelve la caché de soluciones del trabajador para un ancho de tablero.
+# Cada proceso tiene la suya: los tableros de un mismo lote suelen compartir estados cercanos al objetivo.
+def _cache_for(width):
+    caches = _worker["caches"]
+    if width not in caches:
+        caches[width] = SolutionCache(width, _worker["cache_size"], _worker["goal"])
+    return caches[width]
+
+# Resuelve un tablero y devuelve su resultado como diccionario.
+def solve_line(item):
+    line_number, line = item
+    result = {"line": line_number}
+    try:
+        board = parse_board(line)
+        result["board"] = board
+        method = _worker["method"]
+        options = {"stats": SolverStats(track_memory=_worker["track_memory"])}
+        if method in HEURISTIC_METHODS and _worker["heuristic"] != "manhattan":
+            options["heuristic"] = _heuristic_for(board_width(board))
+        if method in CACHE_METHODS and _worker["cache_size"]:
+            options["cache"] = _cache_for(board_width(board))
+        if method == "anytime":
+            options.update(_worker["budget"])
+        if _worker["goal"] is not None:
+            options["goal"] = _worker["goal"]
+        if method == "table":
+            from lookup_table import solve_table
+            path = solve_table(board, **options)
+        else:
+            path = SOLVERS[method](board, **options)
+    except ValueError as error:
+        result["error"] = str(error)
+        return result
+
+    result["solvable"] = path is not None
+    result["length"] = None if path is None else len(path)
+    result.update(options["stats"].as_dict())
+    result["time"] = round(result.pop("elapsed"), 6)
+    if _worker["include_path"] and path is not None:
+        result["moves"] = [move for move, _ in path]
+    return result
+
+# Lee las líneas útiles (con su número) de un archivo abierto.
+def read_boards(file):
+    for line_number, line in enumerate(file, 1):
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield line_number, line
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Resuelve tableros del puzzle por lotes y escribe resultados JSONL.")
+    parser.add_argument("input", nargs="?", default="-", help="Archivo con un tablero por línea (- para entrada estándar).")
+    parser.add_argument("--method", choices=METHODS, default="a_star", help="Solucionador a usar.")
+    parser.add_argument("--heuristic", choices=sorted(HEURISTICS), default="manhattan", help="Heurística para a_star/ida_star/anytime.")
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count(), help="Procesos en paralelo.")
+    parser.add_argument("--chunksize", type=int, default=1, help="Tableros enviados a la vez a cada proceso.")
+    parser.add_argument("--moves", action="store_true", help="Incluye la lista de movimientos en cada resultado.")
+    parser.add_argument("--memory", action="store_true", help="Mide el pico de memoria de cada búsqueda (más lento).")
+    parser.add_argument("--time-limit", type=float, help="Segundos por tablero para mejorar la solución (anytime).")
+    parser.add_argument("--node-limit", type=int, help="Nodos expandidos por tablero para mejorar la solución (anytime).")
+    parser.add_argument("--cache", type=int, default=100000, help="Estados en la caché de soluciones de cada proceso (0 la desactiva).")
+    parser.add_argument("--goal", type=parse_board, help="Objetivo propio, con el mismo formato que los tableros (p. ej. 1,2,3,8,0,4,7,6,5).")
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    started = time.perf_counter()
+    solved = total = 0
+    budget = {"time_limit": args.time_limit, "node_limit": args.node_limit}
+    init_args = (args.method, args.heuristic, args.moves, args.memory, args.cache, budget, args.goal)
+
+    with source:
+        if args.workers > 1:
+            pool = multiprocessing.Pool(args.workers, initializer=_init_worker, initargs=init_args)
+            results = pool.imap_unordered(solve_line, read_boards(source), chunksize=args.chunksize)
+        else:
+            pool = None
+            _init_worker(*init_args)
+            results = map(solve_line, read_boards(source))
+
+        try:
+            for result in results:
+                total += 1
+                solved += result.get("length") is not None
+                sys.stdout.write(json.dumps(result) + "\n")
+                sys.stdout.flush()
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+    elapsed = time.perf_counter() - started
+    rate = total / elapsed if elapsed else 0.0
+    print(f"{total} tableros ({solved} resueltos) en {elapsed:.2f} s: {rate:.1f} tableros/s.", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
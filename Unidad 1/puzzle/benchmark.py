@@ -0,0 +1,172 @@
+# Banco de pruebas reproducible de los solucionadores del puzzle 8.
+# Autor: Espinoza Felix Fausto Gabriel.
+# Fecha: 2026-10-18.
+#
+# Uso: py benchmark.py --depths 10 20 31 --count 5 --output reporte.json --baseline base.json
+#
+# Genera con una semilla fija tableros a distancias óptimas exactas (según la tabla perfecta), ejecuta cada
+# solucionador con cada heurística y guarda tiempo, nodos expandidos y pico de memoria en un reporte JSON.
+# Con --baseline compara contra un reporte anterior y termina con código 1 si algo empeoró.
+import argparse
+import functools
+import json
+import random
+import sys
+
+from heuristics import make_heuristic
+from lookup_table import depth_index, solve_table
+from model import SolverStats, a_star, anytime_a_star, bidirectional_search, ida_star, unrank_board
+from parallel_search import hda_star
+
+DEFAULT_DEPTHS = (10, 20, 31)
+
+# Diferencias absolutas por debajo de las cuales tiempo y memoria se consideran ruido de medición.
+NOISE_FLOOR = {"time": 0.01, "peak_memory": 65536}
+
+# Configuraciones a medir: nombre -> (solucionador, nombre de la heurística o None).
+# anytime va sin presupuesto: termina con peso 1.0, así que debe devolver caminos óptimos.
+# hda_star usa un solo proceso: con varios, los nodos expandidos dependen del reparto entre procesos y no sirven
+# para detectar regresiones; su memoria es solo la del proceso principal.
+CONFIGS = {
+    "a_star/manhattan": (a_star, None),
+    "a_star/pdb": (a_star, "pdb"),
+    "a_star/linear_conflict": (a_star, "linear_conflict"),
+    "a_star/walking_distance": (a_star, "walking_distance"),
+    "ida_star/manhattan": (ida_star, None),
+    "ida_star/pdb": (ida_star, "pdb"),
+    "ida_star/linear_conflict": (ida_star, "linear_conflict"),
+    "ida_star/walking_distance": (ida_star, "walking_distance"),
+    "anytime/manhattan": (anytime_a_star, None),
+    "anytime/pdb": (anytime_a_star, "pdb"),
+    "anytime/linear_conflict": (anytime_a_star, "linear_conflict"),
+    "anytime/walking_distance": (anytime_a_star, "walking_distance"),
+    "hda_star/manhattan": (functools.partial(hda_star, workers=1), None),
+    "hda_star/pdb": (functools.partial(hda_star, workers=1), "pdb"),
+    "bidirectional": (bidirectional_search, None),
+    "table": (solve_table, None),
+}
+
+# Genera, para cada profundidad, count tableros con exactamente esa distancia óptima.
+def build_corpus(depths, count, seed):
+    groups = depth_index(3)
+    rng = random.Random(seed)
+    corpus = {}
+    for depth in depths:
+        indices = groups.get(depth)
+        if not indices:
+            raise ValueError(f"No hay tableros a distancia {depth}.")
+        chosen = rng.sample(indices, min(count, len(indices)))
+        corpus[depth] = [unrank_board(index, 3) for index in sorted(chosen)]
+    return corpus
+
+# Crea las heurísticas que usan las configuraciones (None es Manhattan en línea).
+def _heuristics(configs):
+    names = {name for _, name in configs.values() if name is not None}
+    heuristics = {name: make_heuristic(name, 3) for name in names}
+    heuristics[None] = None
+    return heuristics
+
+# Ejecuta una configuración sobre un grupo de tableros y devuelve sus totales.
+# Se hacen dos pasadas: una para el tiempo y otra, con tracemalloc, para la memoria.
+def run_config(solver, heuristic, boards, depth):
+    options = {} if heuristic is None else {"heuristic": heuristic}
+    elapsed = expanded = 0
+    peak_memory = 0
+    wrong = 0
+    for board in boards:
+        stats = SolverStats()
+        path = solver(board, stats=stats, **options)
+        if path is None or len(path) != depth:
+            wrong += 1      # Un camino no óptimo es una regresión de correctitud.
+        elapsed += stats.elapsed
+        expanded += stats.expanded
+
+        memory_stats = SolverStats(track_memory=True)
+        solver(board, stats=memory_stats, **options)
+        peak_memory = max(peak_memory, memory_stats.peak_memory)
+
+    return {
+        "boards": len(boards),
+        "time": round(elapsed, 6),
+        "expanded": expanded,
+        "peak_memory": peak_memory,
+        "wrong": wrong,
+    }
+
+# Ejecuta todas las configuraciones sobre el corpus.
+def run_benchmark(corpus, configs=CONFIGS):
+    heuristics = _heuristics(configs)
+    results = {}
+    for name, (solver, heuristic_name) in configs.items():
+        results[name] = {}
+        for depth, boards in corpus.items():
+            results[name][str(depth)] = run_config(solver, heuristics[heuristic_name], boards, depth)
+            print(f"{name:20} profundidad {depth:2}: {results[name][str(depth)]}", file=sys.stderr)
+    return results
+
+# Compara un reporte con la línea base y devuelve la lista de regresiones encontradas.
+# Nodos expandidos y caminos incorrectos son deterministas: cualquier aumento cuenta.
+# Tiempo y memoria dependen de la máquina, así que solo cuentan si superan la tolerancia relativa
+# y además el umbral absoluto de NOISE_FLOOR.
+def compare(report, baseline, tolerance=0.25):
+    if baseline.get("corpus") != report["corpus"]:
+        raise ValueError("La línea base se generó con otro corpus (semilla, profundidades o cantidad distintas).")
+    regressions = []
+    for name, by_depth in report["results"].items():
+        for depth, current in by_depth.items():
+            previous = baseline.get("results", {}).get(name, {}).get(depth)
+            if previous is None or previous.get("boards") != current["boards"]:
+                continue
+            label = f"{name} (profundidad {depth})"
+            if current["wrong"] > previous["wrong"]:
+                regressions.append(f"{label}: {current['wrong']} caminos no óptimos")
+            if current["expanded"] > previous["expanded"]:
+                regressions.append(f"{label}: nodos expandidos {previous['expanded']} -> {current['expanded']}")
+            for key, floor in NOISE_FLOOR.items():
+                if current[key] - previous[key] > max(previous[key] * tolerance, floor):
+                    regressions.append(f"{label}: {key} {previous[key]} -> {current[key]}")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mide los solucionadores del puzzle 8 sobre corpus por profundidad.")
+    parser.add_argument("--depths", type=int, nargs="+", default=list(DEFAULT_DEPTHS), help="Distancias óptimas del corpus.")
+    parser.add_argument("--count", type=int, default=5, help="Tableros por profundidad.")
+    parser.add_argument("--seed", type=int, default=2025, help="Semilla del corpus.")
+    parser.add_argument("--configs", nargs="+", choices=sorted(CONFIGS), help="Configuraciones a medir (todas por defecto).")
+    parser.add_argument("--output", help="Archivo donde guardar el reporte JSON (por defecto, salida estándar).")
+    parser.add_argument("--baseline", help="Reporte anterior contra el que buscar regresiones.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Aumento relativo tolerado en tiempo y memoria.")
+    args = parser.parse_args(argv)
+
+    configs = {name: CONFIGS[name] for name in (args.configs or CONFIGS)}
+    corpus = build_corpus(args.depths, args.count, args.seed)
+    report = {
+        "seed": args.seed,
+        "count": args.count,
+        "corpus": {str(depth): boards for depth, boards in corpus.items()},
+        "results": run_benchmark(corpus, configs),
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+        try:
+            regressions = compare(report, baseline, args.tolerance)
+        except ValueError as error:
+            print(error, file=sys.stderr)
+            sys.exit(2)
+        for regression in regressions:
+            print(f"REGRESIÓN: {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+        print("Sin regresiones respecto a la línea base.", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
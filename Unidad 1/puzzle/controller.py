@@ -1,87 +1,146 @@
-# Importa el algoritmo A* y random para mezclar el puzzle.
+# Importa los solucionadores (tabla perfecta/IDA*) y el generador de tableros aleatorios.
 # Autor: Espinoza Felix Fausto Gabriel.
 # Fecha: 2025-8-31.
-from model import a_star
-import random
+from model import ida_star, goal_board, get_tables, random_solvable_board, SearchCancelled, SolutionCache, SolverStats
+from lookup_table import solve_table
+from heuristics import make_heuristic, WALKING_MAX_WIDTH
+from pattern_db import default_patterns_ready
+import functools
+import threading
+
+POLL_MS = 100   # Cada cuánto se revisa el hilo de búsqueda desde la interfaz.
 
 class PuzzleController:
     
-    # Inicializa atributos para animación y estado del juego.
-    def __init__(self, view):
+    # Inicializa atributos para animación y estado del juego (tablero de size x size).
+    # goal es opcional: una disposición objetivo propia (por defecto, fichas en orden y blanco al final).
+    def __init__(self, view, size=3, goal=None):
         self.view = view
+        self.size = size
+        self.goal = list(goal) if goal else goal_board(size)        # Estado resuelto.
+        self._custom_goal = None if self.goal == goal_board(size) else self.goal   # goal= de los solucionadores.
+        self._moves = get_tables(size).moves
+        self._cache = SolutionCache(size, goal=self._custom_goal)  # Soluciones anteriores de la sesión, reutilizadas por IDA*.
+        self._heuristic = None             # Heurística de IDA*, creada al resolver por primera vez.
         self._solution_states = []
         self._animate_index = 0
         self._is_solving = False
         self._animation_id = None
         self._solution_length = 0
+        self._worker = None         # Hilo que ejecuta la búsqueda.
+        self._worker_result = None  # Caja propia de cada búsqueda donde el hilo deja la solución.
+        self._cancel = None         # Evento para cancelar la búsqueda en curso.
+        self._stats = None          # Progreso de la búsqueda (nodos expandidos).
+        self._poll_id = None
         self.moves_count = 0
         self.board = [] # Estado actual del tablero.
         self.restart_puzzle()
 
-    # Detiene la animación si está activa.
+    # Indica si hay una búsqueda o una animación en curso.
+    def is_solving(self):
+        return self._is_solving
+
+    # Cancela la búsqueda en segundo plano y detiene la animación si está activa.
     def stop_solving(self):
-        if self._is_solving and self._animation_id:
+        if self._cancel is not None:
+            self._cancel.set()      # El hilo termina en su siguiente punto de control.
+            self._cancel = None
+            self._worker = None
+        if self._poll_id:
+            self.view.root.after_cancel(self._poll_id)
+            self._poll_id = None
+        if self._animation_id:
             self.view.root.after_cancel(self._animation_id)
-            self._is_solving = False
             self._animation_id = None
+        self._is_solving = False
 
-    # Reinicia el estado del puzzle con una mezcla aleatoria.
+    # Reinicia el estado del puzzle con un tablero solucionable elegido uniformemente al azar.
     def restart_puzzle(self):
         self.stop_solving()
         self.moves_count = 0
-        self.board = [1, 2, 3, 4, 5, 6, 7, 8, 0]    # Estado resuelto.
+        self.board = self.goal[:]
         
-        for _ in range(1000):
-            blank = self.board.index(0) # Posición del espacio vacío.
-            neighbors = []
-            if blank - 3 >= 0:
-                neighbors.append(blank - 3)
-            if blank + 3 < 9:
-                neighbors.append(blank + 3)
-            if blank % 3 != 0:
-                neighbors.append(blank - 1)
-            if blank % 3 != 2:
-                neighbors.append(blank + 1)
-                
-            if neighbors:
-                move_pos = random.choice(neighbors)
-                self.board[blank], self.board[move_pos] = self.board[move_pos], self.board[blank]   # Intercambia las fichas.
+        while self.board == self.goal:
+            self.board = random_solvable_board(self.size, goal=self._custom_goal)
         
         self.view.update_board(self.board)
         self.view.update_moves_counter(self.moves_count)
+        self.view.show_stats(None)
 
-    # Mueve una ficha si es adyacente al espacio vacío.
+    # Mueve una ficha si es adyacente al espacio vacío (ignorado mientras se resuelve).
     def move_tile(self, index):
+        if self._is_solving:
+            return
         blank = self.board.index(0)
-        neighbors = []
-        if blank - 3 >= 0:
-            neighbors.append(blank - 3)
-        if blank + 3 < 9:
-            neighbors.append(blank + 3)
-        if blank % 3 != 0:
-            neighbors.append(blank - 1)
-        if blank % 3 != 2:
-            neighbors.append(blank + 1)
+        neighbors = [pos for _, pos in self._moves[blank]]
         if index in neighbors:
             self.board[blank], self.board[index] = self.board[index], self.board[blank]
             self.moves_count += 1
             self.view.update_board(self.board)
             self.view.update_moves_counter(self.moves_count)
             
-            if self.board == [1, 2, 3, 4, 5, 6, 7, 8, 0]:
+            if self.board == self.goal:
                 self.view.status_label.config(text=f"¡Felicidades! Resolviste el puzzle en {self.moves_count} movimientos!")
 
-    # Resuelve el puzzle automáticamente usando A*.
+    # Resuelve el puzzle automáticamente con la tabla perfecta en 3x3 (IDA* con la caché de la sesión en tableros
+    # mayores, con la PDB si sus archivos ya están en data/ y si no con walking distance o conflicto lineal).
+    # La búsqueda corre en un hilo aparte; la interfaz la revisa con root.after sin congelarse.
     def solve_puzzle(self):
         
         self._is_solving = True
         
-        if self.board == [1, 2, 3, 4, 5, 6, 7, 8, 0]:
+        if self.board == self.goal:
             self._is_solving = False
             self.view.on_solve_complete(True)
             return
     
-        solution = a_star(self.board)
+        if self.size == 3:
+            solver = functools.partial(solve_table, goal=self._custom_goal)
+        else:
+            if self._heuristic is None:
+                goal_blank = self.goal.index(0)
+                if default_patterns_ready(self.size, goal_blank=goal_blank):
+                    name = "pdb"
+                elif self.size <= WALKING_MAX_WIDTH:
+                    name = "walking_distance"
+                else:
+                    name = "linear_conflict"
+                self._heuristic = make_heuristic(name, self.size, self._custom_goal)
+            solver = functools.partial(ida_star, heuristic=self._heuristic, cache=self._cache, goal=self._custom_goal)
+        self._cancel = threading.Event()
+        self._stats = SolverStats()
+        self._worker_result = {}
+        self._worker = threading.Thread(
+            target=self._run_solver,
+            args=(solver, self.board[:], self._stats, self._cancel, self._worker_result),
+            daemon=True
+        )
+        self._worker.start()
+        self._poll_id = self.view.root.after(POLL_MS, self._poll_solver)
+
+    # Ejecuta el solucionador en el hilo de trabajo; no toca la interfaz.
+    # Escribe solo en su propia caja, así un hilo cancelado no pisa el resultado de una búsqueda nueva.
+    @staticmethod
+    def _run_solver(solver, board, stats, cancel, result):
+        try:
+            result["solution"] = solver(board, stats=stats, cancel=cancel)
+        except SearchCancelled:
+            pass
+
+    # Revisa el hilo de búsqueda desde el hilo de la interfaz: muestra el progreso o recoge la solución.
+    def _poll_solver(self):
+        self._poll_id = None
+        if self._worker is None:
+            return
+        if self._worker.is_alive():
+            self.view.update_progress(self._stats.expanded)
+            self._poll_id = self.view.root.after(POLL_MS, self._poll_solver)
+            return
+
+        solution = self._worker_result.get("solution")
+        self._worker = None
+        self._cancel = None
+        self.view.show_stats(self._stats)
         if not solution:
             self._is_solving = False
             self.view.on_solve_complete(False)
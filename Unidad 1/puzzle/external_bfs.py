@@ -0,0 +1,190 @@
+# BFS en memoria externa: distancia óptima de todos los tableros de un ancho, con las capas en disco.
+# Autor: Espinoza Felix Fausto Gabriel.
+# Fecha: 2026-10-18.
+#
+# Uso: py external_bfs.py 3 --chunk 100000 --fan-in 64
+#
+# Cada capa del BFS es un archivo de índices (rank_board) ordenados y sin repetir, 8 bytes por tablero.
+# Los vecinos de la capa d se generan por bloques de chunk tableros; cada bloque se ordena y se guarda como una
+# corrida, y las corridas se mezclan (merge) quitando repetidos y los tableros de las capas d - 1 y d.
+# Cada corrida abierta usa un archivo, así que se mezclan de a lo más fan_in por pasada: si hay más, se combinan
+# por grupos en corridas intermedias hasta que quedan fan_in o menos, y nunca se supera el límite de archivos abiertos.
+# En memoria solo hay un bloque y un búfer por archivo abierto, sin importar el tamaño del espacio de estados.
+# El resultado tiene el formato de la tabla perfecta (un byte de distancia por índice) y se acompaña del
+# histograma de tableros por distancia en JSON.
+import argparse
+import heapq
+import json
+import mmap
+import os
+import shutil
+import tempfile
+import time
+from array import array
+
+from lookup_table import DATA_DIR, UNKNOWN, table_path
+from model import PuzzleState, get_tables, rank_board, state_count, unrank_board
+
+CHUNK_SIZE = 1 << 20    # Tableros cuyos vecinos se ordenan juntos en memoria (una corrida).
+BLOCK_RECORDS = 8192    # Índices que se leen o escriben de una vez en cada archivo.
+MERGE_FAN_IN = 64       # Corridas que se mezclan a la vez (cada una tiene su archivo abierto).
+
+# Lee un archivo de índices por bloques y los devuelve uno a uno.
+def _read_records(path):
+    with open(path, "rb") as file:
+        while True:
+            block = array("Q")
+            block.frombytes(file.read(BLOCK_RECORDS * block.itemsize))
+            if not block:
+                return
+            yield from block
+
+# Escribe una secuencia de índices por bloques y devuelve cuántos escribió.
+def _write_records(path, values):
+    count = 0
+    block = array("Q")
+    with open(path, "wb") as file:
+        for value in values:
+            block.append(value)
+            if len(block) == BLOCK_RECORDS:
+                block.tofile(file)
+                count += len(block)
+                block = array("Q")
+        block.tofile(file)
+    return count + len(block)
+
+# Mezcla archivos ordenados en una sola secuencia ordenada sin repetidos.
+def _merge_unique(paths):
+    previous = None
+    for value in heapq.merge(*(_read_records(path) for path in paths)):
+        if value != previous:
+            yield value
+            previous = value
+
+# Mezcla las corridas por grupos de fan_in en corridas intermedias hasta que queden fan_in o menos,
+# borrando las ya mezcladas. Devuelve las rutas de las corridas que quedan.
+def _reduce_runs(runs, work_dir, fan_in=MERGE_FAN_IN):
+    level = 0
+    while len(runs) > fan_in:
+        merged = []
+        for start in range(0, len(runs), fan_in):
+            group = runs[start:start + fan_in]
+            merged.append(os.path.join(work_dir, f"merge_{level}_{len(merged)}.bin"))
+            _write_records(merged[-1], _merge_unique(group))
+            for run in group:
+                os.remove(run)
+        runs = merged
+        level += 1
+    return runs
+
+# Quita de una secuencia ordenada los valores que aparecen en los archivos ordenados excluded (recorrido en paralelo).
+def _difference(values, excluded):
+    excluded = heapq.merge(*(_read_records(path) for path in excluded))
+    other = next(excluded, None)
+    for value in values:
+        while other is not None and other < value:
+            other = next(excluded, None)
+        if value != other:
+            yield value
+
+# Marca en el archivo de distancias (mapeado en memoria) todos los tableros de una capa.
+def _mark_layer(distances, path, depth):
+    for index in _read_records(path):
+        distances[index] = depth
+
+# Crea el archivo de distancias lleno de UNKNOWN, escribiéndolo por bloques.
+def _create_distance_file(path, size):
+    block = bytes([UNKNOWN]) * (BLOCK_RECORDS * 8)
+    with open(path, "wb") as file:
+        for start in range(0, size, len(block)):
+            file.write(block[:size - start])
+
+# BFS desde el objetivo sobre todos los tableros de width x width, con las capas en archivos de work_dir
+# (por defecto, una carpeta temporal dentro de directory que se borra al terminar).
+# Escribe la tabla de distancias en table_path(width, directory, goal_blank) y el histograma junto a ella.
+# fan_in es el máximo de corridas mezcladas a la vez. Devuelve (ruta de la tabla, {distancia: tableros}).
+# Los vecinos salen de PuzzleState.get_neighbors.
+def external_bfs(width=3, directory=DATA_DIR, goal_blank=None, chunk_size=CHUNK_SIZE, work_dir=None,
+                 fan_in=MERGE_FAN_IN):
+    if chunk_size < 1:
+        raise ValueError("El tamaño de bloque debe ser al menos 1.")
+    if fan_in < 2:
+        raise ValueError("Se deben mezclar al menos 2 corridas a la vez.")
+    tables = get_tables(width, goal_blank)
+    os.makedirs(directory, exist_ok=True)
+    path = table_path(width, directory, tables.goal_blank)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    work_dir = tempfile.mkdtemp(prefix="bfs_", dir=work_dir or directory)
+    histogram = {0: 1}
+
+    try:
+        _create_distance_file(temp_path, state_count(width))
+        with open(temp_path, "r+b") as file, mmap.mmap(file.fileno(), 0) as distances:
+            previous = None
+            current = os.path.join(work_dir, "layer_0.bin")
+            _write_records(current, [rank_board(tables.goal)])
+            _mark_layer(distances, current, 0)
+            depth = 0
+
+            while True:
+                runs = []
+                chunk = []
+                for index in _read_records(current):
+                    state = PuzzleState(unrank_board(index, width, tables.goal_blank))
+                    chunk.extend(rank_board(child.board) for child in state.get_neighbors())
+                    if len(chunk) >= chunk_size:
+                        runs.append(os.path.join(work_dir, f"run_{len(runs)}.bin"))
+                        _write_records(runs[-1], sorted(set(chunk)))
+                        chunk = []
+                if chunk:
+                    runs.append(os.path.join(work_dir, f"run_{len(runs)}.bin"))
+                    _write_records(runs[-1], sorted(set(chunk)))
+
+                runs = _reduce_runs(runs, work_dir, fan_in)
+                following = os.path.join(work_dir, f"layer_{depth + 1}.bin")
+                seen = [layer for layer in (previous, current) if layer is not None]
+                count = _write_records(following, _difference(_merge_unique(runs), seen))
+                for run in runs:
+                    os.remove(run)
+                if not count:
+                    break
+                depth += 1
+                if depth >= UNKNOWN:
+                    raise ValueError(f"La distancia {depth} no cabe en un byte de la tabla.")
+                histogram[depth] = count
+                _mark_layer(distances, following, depth)
+                if previous is not None:
+                    os.remove(previous)     # Ya no puede contener vecinos de las capas siguientes.
+                previous, current = current, following
+            distances.flush()
+        os.replace(temp_path, path)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+    with open(f"{os.path.splitext(path)[0]}_histogram.json", "w", encoding="utf-8") as file:
+        json.dump({str(depth): count for depth, count in histogram.items()}, file, indent=2)
+    return path, histogram
+
+# Genera desde consola la tabla de un ancho e imprime el histograma.
+def main():
+    parser = argparse.ArgumentParser(description="Enumera todos los tableros de un ancho con un BFS en disco.")
+    parser.add_argument("width", type=int, nargs="?", default=3, help="Ancho del tablero.")
+    parser.add_argument("--chunk", type=int, default=CHUNK_SIZE, help="Tableros por corrida ordenada en memoria.")
+    parser.add_argument("--fan-in", type=int, default=MERGE_FAN_IN, help="Corridas que se mezclan a la vez.")
+    parser.add_argument("--goal-blank", type=int, help="Casilla del blanco en el objetivo (por defecto, la última).")
+    parser.add_argument("--directory", default=DATA_DIR, help="Carpeta de salida.")
+    parser.add_argument("--work-dir", help="Carpeta para las capas intermedias (por defecto, dentro de la de salida).")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    path, histogram = external_bfs(args.width, args.directory, args.goal_blank, args.chunk, args.work_dir,
+                                   args.fan_in)
+    for depth, count in histogram.items():
+        print(f"{depth:3}: {count:,}")
+    print(f"{path}: {sum(histogram.values()):,} tableros, distancia máxima {max(histogram)}, "
+          f"en {time.perf_counter() - started:.1f} s.")
+
+if __name__ == "__main__":
+    main()
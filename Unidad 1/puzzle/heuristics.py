@@ -0,0 +1,223 @@
+# Heurísticas intercambiables para los solucionadores: interfaz común, registro por nombre,
+# conflicto lineal y walking distance con tablas precalculadas.
+# Autor: Espinoza Felix Fausto Gabriel.
+# Fecha: 2026-10-18.
+from model import ManhattanHeuristic, decode_board, encode_board, get_tables
+from pattern_db import PatternDatabase
+
+# Interfaz de heurística que aceptan a_star, ida_star y anytime_a_star (heuristic=...):
+#   evaluate(board)                   -> h completa de un tablero.
+#   update(h, code, tile, src, dst)   -> h del hijo (code, empaquetado) tras mover tile de src a dst.
+# Basta con implementar evaluate; update por defecto recalcula h desde el tablero.
+# Con goal, la heurística mide la distancia al objetivo canónico con el mismo blanco (ver model.goal_frame).
+class Heuristic:
+
+    def __init__(self, width, goal=None):
+        self.width = width
+        self.tables = get_tables(width, None if goal is None else goal.index(0))
+        self.goal_blank = self.tables.goal_blank
+
+    def evaluate(self, board):
+        raise NotImplementedError
+
+    def update(self, h, code, tile, src, dst):
+        return self.evaluate(decode_board(code, self.tables.cells))
+
+# Heurísticas disponibles por nombre: nombre -> clase (o función) que recibe el ancho del tablero y, opcionalmente, goal.
+HEURISTICS = {
+    "manhattan": ManhattanHeuristic,
+    "pdb": PatternDatabase,
+}
+
+# Registra una heurística con un nombre (se usa como decorador de clase).
+def register_heuristic(name):
+    def decorator(factory):
+        HEURISTICS[name] = factory
+        return factory
+    return decorator
+
+# Crea la heurística registrada con ese nombre para tableros de width x width (y el objetivo goal, si se da).
+def make_heuristic(name, width, goal=None):
+    if name not in HEURISTICS:
+        raise ValueError(f"Heurística desconocida: {name}. Opciones: {', '.join(HEURISTICS)}.")
+    if goal is None:
+        return HEURISTICS[name](width)
+    return HEURISTICS[name](width, goal=goal)
+
+# Número mínimo de fichas que hay que sacar de una línea para que las demás queden en orden:
+# las que pertenecen a la línea menos la subsecuencia creciente más larga de sus posiciones objetivo.
+def _line_conflicts(targets):
+    longest = []
+    for i, target in enumerate(targets):
+        longest.append(1 + max((longest[j] for j in range(i) if targets[j] < target), default=0))
+    return len(targets) - max(longest, default=0)
+
+# Manhattan más conflicto lineal: dos fichas de la misma fila (o columna) objetivo que están invertidas en ella
+# obligan a que una salga de la línea y vuelva, así que cada ficha que hay que sacar suma 2 movimientos.
+# Los conflictos de cada fila/columna se guardan en tablas por contenido empaquetado de la línea, que se llenan
+# con el primer tablero que las usa. Un movimiento solo cambia dos líneas (dos columnas si es horizontal,
+# dos filas si es vertical), y su contenido anterior sale del nuevo reponiendo la ficha movida.
+@register_heuristic("linear_conflict")
+class LinearConflictHeuristic(Heuristic):
+
+    def __init__(self, width, goal=None):
+        super().__init__(width, goal)
+        tables = self.tables
+        goal = tables.goal
+        self._row_of = [goal.index(tile) // width if tile else -1 for tile in range(tables.cells)]
+        self._col_of = [goal.index(tile) % width if tile else -1 for tile in range(tables.cells)]
+        self._row_mask = (1 << (width * tables.bits)) - 1
+        self._rows = [{} for _ in range(width)]   # Fila -> {contenido empaquetado: conflictos}.
+        self._cols = [{} for _ in range(width)]   # Columna -> {contenido empaquetado: conflictos}.
+
+    # Contenido empaquetado de una fila y de una columna (la ficha de la fila i en los bits i * bits).
+    def _row_key(self, code, row):
+        return (code >> (row * self.width * self.tables.bits)) & self._row_mask
+
+    def _col_key(self, code, col):
+        width, bits, mask = self.width, self.tables.bits, self.tables.mask
+        key = 0
+        for i in range(width):
+            key |= ((code >> ((i * width + col) * bits)) & mask) << (i * bits)
+        return key
+
+    # Conflictos de una línea con el contenido key: tables es self._rows o self._cols.
+    def _conflicts(self, tables, line, key):
+        conflicts = tables[line].get(key)
+        if conflicts is None:
+            bits, mask = self.tables.bits, self.tables.mask
+            if tables is self._rows:
+                members, targets = self._row_of, self._col_of
+            else:
+                members, targets = self._col_of, self._row_of
+            tiles = [(key >> (i * bits)) & mask for i in range(self.width)]
+            conflicts = tables[line][key] = _line_conflicts([targets[tile] for tile in tiles if members[tile] == line])
+        return conflicts
+
+    def evaluate(self, board):
+        code = encode_board(board)
+        conflicts = 0
+        for line in range(self.width):
+            conflicts += self._conflicts(self._rows, line, self._row_key(code, line))
+            conflicts += self._conflicts(self._cols, line, self._col_key(code, line))
+        return sum(self.tables.manhattan[tile][pos] for pos, tile in enumerate(board) if tile) + 2 * conflicts
+
+    def update(self, h, code, tile, src, dst):
+        bits = self.tables.bits
+        h += self.tables.manhattan[tile][dst] - self.tables.manhattan[tile][src]
+        src_row, src_col = divmod(src, self.width)
+        dst_row, dst_col = divmod(dst, self.width)
+        if src_row == dst_row:      # Movimiento horizontal: cambian dos columnas.
+            tables, first, second, shift = self._cols, src_col, dst_col, src_row * bits
+            first_key, second_key = self._col_key(code, src_col), self._col_key(code, dst_col)
+        else:                       # Movimiento vertical: cambian dos filas.
+            tables, first, second, shift = self._rows, src_row, dst_row, src_col * bits
+            first_key, second_key = self._row_key(code, src_row), self._row_key(code, dst_row)
+        # Antes del movimiento la ficha estaba en src (donde ahora está el blanco) y no en dst.
+        old_first, old_second = first_key | (tile << shift), second_key ^ (tile << shift)
+        conflicts = self._conflicts
+        return h + 2 * (conflicts(tables, first, first_key) + conflicts(tables, second, second_key)
+                        - conflicts(tables, first, old_first) - conflicts(tables, second, old_second))
+
+# Tabla de walking distance de un ancho: BFS sobre la matriz counts[fila][fila objetivo] (cuántas fichas de cada
+# fila objetivo hay en cada fila) más la fila del blanco. Cada paso lleva una ficha de una fila vecina a la del
+# blanco. El estado se codifica en base width + 1: sum(counts[i][j] * R^(i*width + j)) + fila_blanco * R^(width^2).
+# blank_line es la fila (o columna, por simetría) del blanco en el objetivo.
+_WALKING = {}
+WALKING_MAX_WIDTH = 4   # En 5x5 la tabla ya tiene millones de estados.
+
+def _walking_table(width, blank_line):
+    key = (width, blank_line)
+    if key in _WALKING:
+        return _WALKING[key]
+    radix = width + 1
+    counts = [0] * (width * width)
+    for row in range(width):
+        counts[row * width + row] = width
+    counts[blank_line * width + blank_line] -= 1     # El blanco no es una ficha de su fila objetivo.
+    start = sum(count * radix ** i for i, count in enumerate(counts)) + blank_line * radix ** (width * width)
+    distances = {start: 0}
+    layer = [(counts, blank_line, start)]
+    depth = 0
+
+    while layer:
+        depth += 1
+        next_layer = []
+        for counts, blank_row, index in layer:
+            for row in (blank_row - 1, blank_row + 1):
+                if not 0 <= row < width:
+                    continue
+                for goal_row in range(width):
+                    if not counts[row * width + goal_row]:
+                        continue
+                    child = counts[:]
+                    child[row * width + goal_row] -= 1
+                    child[blank_row * width + goal_row] += 1
+                    child_index = (index - radix ** (row * width + goal_row) + radix ** (blank_row * width + goal_row)
+                                   + (row - blank_row) * radix ** (width * width))
+                    if child_index not in distances:
+                        distances[child_index] = depth
+                        next_layer.append((child, row, child_index))
+        layer = next_layer
+
+    _WALKING[key] = distances
+    return distances
+
+# Walking distance: cuenta por separado los movimientos verticales (con la matriz de filas) y los horizontales
+# (con la de columnas, que por simetría usa la misma tabla), ignorando qué ficha concreta se mueve.
+# Es admisible y suele superar ampliamente a Manhattan, porque considera que las fichas se estorban al cambiar de fila.
+# El índice de cada matriz es la suma de un peso por (ficha, posición); el blanco aporta su fila/columna.
+# update suma los aportes de cada fila empaquetada, guardados por contenido de la fila en cuanto aparecen.
+@register_heuristic("walking_distance")
+class WalkingDistanceHeuristic(Heuristic):
+
+    def __init__(self, width, goal=None):
+        if width > WALKING_MAX_WIDTH:
+            raise ValueError(f"Walking distance solo está disponible hasta {WALKING_MAX_WIDTH}x{WALKING_MAX_WIDTH}.")
+        super().__init__(width, goal)
+        tables = self.tables
+        radix = width + 1
+        blank_row, blank_col = divmod(tables.goal_blank, width)
+        self._vertical_distances = _walking_table(width, blank_row)
+        self._horizontal_distances = _walking_table(width, blank_col)
+        self._vertical = [[0] * tables.cells for _ in range(tables.cells)]      # [ficha][posición] -> peso.
+        self._horizontal = [[0] * tables.cells for _ in range(tables.cells)]
+        for tile in range(tables.cells):
+            target = tables.goal.index(tile)
+            for pos in range(tables.cells):
+                row, col = divmod(pos, width)
+                if tile:
+                    self._vertical[tile][pos] = radix ** (row * width + target // width)
+                    self._horizontal[tile][pos] = radix ** (col * width + target % width)
+                else:
+                    self._vertical[0][pos] = row * radix ** (width * width)
+                    self._horizontal[0][pos] = col * radix ** (width * width)
+        self._row_mask = (1 << (width * tables.bits)) - 1
+        self._rows = [{} for _ in range(width)]   # Fila -> {contenido empaquetado: (aporte vertical, horizontal)}.
+
+    def evaluate(self, board):
+        vertical = sum(self._vertical[tile][pos] for pos, tile in enumerate(board))
+        horizontal = sum(self._horizontal[tile][pos] for pos, tile in enumerate(board))
+        return self._vertical_distances[vertical] + self._horizontal_distances[horizontal]
+
+    def update(self, h, code, tile, src, dst):
+        row_bits = self.width * self.tables.bits
+        vertical = horizontal = 0
+        for row, table in enumerate(self._rows):
+            key = (code >> (row * row_bits)) & self._row_mask
+            weights = table.get(key)
+            if weights is None:
+                weights = table[key] = self._row_weights(key, row)
+            vertical += weights[0]
+            horizontal += weights[1]
+        return self._vertical_distances[vertical] + self._horizontal_distances[horizontal]
+
+    # Aportes (vertical, horizontal) al índice de las fichas de una fila con el contenido empaquetado key.
+    def _row_weights(self, key, row):
+        bits, mask = self.tables.bits, self.tables.mask
+        vertical = horizontal = 0
+        for col in range(self.width):
+            tile = (key >> (col * bits)) & mask
+            vertical += self._vertical[tile][row * self.width + col]
+            horizontal += self._horizontal[tile][row * self.width + col]
+        return vertical, horizontal
@@ -0,0 +1,152 @@
+# Tabla perfecta del puzzle 8: distancia óptima al objetivo de cada uno de los 181,440 tableros alcanzables.
+# Autor: Espinoza Felix Fausto Gabriel.
+# Fecha: 2026-10-18.
+import argparse
+import mmap
+import os
+import random
+import time
+from array import array
+
+from model import (checkpoint, encode_board, get_tables, goal_frame, instrumented, is_solvable, path_from_codes,
+                   rank_board, record_stats, state_count, unrank_board)
+from pattern_db import DATA_DIR, UNKNOWN, save_pattern
+
+MAX_WIDTH = 3   # El puzzle 15 ya tiene ~10^13 estados: no cabe en una tabla.
+_LOADED = {}    # Tablas ya mapeadas en memoria por (ancho, carpeta, blanco del objetivo).
+_DEPTHS = {}    # Índices de depth_index ya agrupados por ancho.
+
+# Ruta del archivo de la tabla de un ancho de tablero (con el blanco del objetivo fuera de la última casilla,
+# lleva el sufijo _b<casilla>).
+def table_path(width=3, directory=DATA_DIR, goal_blank=None):
+    suffix = "" if goal_blank in (None, width * width - 1) else f"_b{goal_blank}"
+    return os.path.join(directory, f"table_{width}x{width}{suffix}.bin")
+
+# BFS desde el objetivo sobre todos los tableros alcanzables; un byte de distancia por índice (rank_board).
+# goal_blank elige el objetivo canónico (por defecto, el blanco en la última casilla).
+def build_table(width=3, goal_blank=None):
+    tables = get_tables(width, goal_blank)
+    moves = tables.moves
+    distances = bytearray([UNKNOWN]) * state_count(width)
+    goal = tables.goal
+    distances[rank_board(goal)] = 0
+    layer = [goal]
+    depth = 0
+
+    while layer:
+        depth += 1
+        next_layer = []
+        for board in layer:
+            blank = board.index(0)
+            for _, new_blank in moves[blank]:
+                child = board[:]
+                child[blank], child[new_blank] = child[new_blank], 0
+                index = rank_board(child)
+                if distances[index] == UNKNOWN:
+                    distances[index] = depth
+                    next_layer.append(child)
+        layer = next_layer
+
+    return distances
+
+# Abre la tabla de un ancho (generándola y guardándola la primera vez) y la deja mapeada en memoria.
+# Hay una tabla por casilla del blanco en el objetivo; cualquier objetivo con ese blanco la usa reetiquetando.
+def load_table(width=3, directory=DATA_DIR, goal_blank=None):
+    if width > MAX_WIDTH:
+        raise ValueError(f"La tabla perfecta solo existe hasta {MAX_WIDTH}x{MAX_WIDTH}; el tablero es {width}x{width}.")
+    goal_blank = get_tables(width, goal_blank).goal_blank
+    key = (width, directory, goal_blank)
+    if key not in _LOADED:
+        path = table_path(width, directory, goal_blank)
+        if not os.path.exists(path):
+            save_pattern(path, build_table(width, goal_blank))
+        with open(path, "rb") as file:
+            _LOADED[key] = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    return _LOADED[key]
+
+# Índices (rank_board) de todos los tableros agrupados por distancia óptima: {distancia: array de índices}.
+# Se calcula una sola vez por tabla; después elegir un tablero de una distancia dada es O(1).
+def depth_index(width=3, directory=DATA_DIR):
+    key = (width, directory)
+    if key not in _DEPTHS:
+        groups = {}
+        for index, depth in enumerate(bytes(load_table(width, directory))):   # bytes: al iterar da enteros.
+            if depth not in groups:
+                groups[depth] = array("I")
+            groups[depth].append(index)
+        _DEPTHS[key] = groups
+    return _DEPTHS[key]
+
+# Tablero elegido uniformemente al azar entre los que están exactamente a la distancia óptima dada.
+def random_board_at_depth(depth, width=3, rng=random):
+    indices = depth_index(width).get(depth)
+    if not indices:
+        raise ValueError(f"No hay tableros {width}x{width} a distancia {depth}.")
+    return unrank_board(indices[rng.randrange(len(indices))], width)
+
+# Distancia óptima de un tablero al objetivo (o a goal, si se da; None si no es solucionable).
+def distance(board, goal=None):
+    board, tables, _ = goal_frame(board, goal)
+    if not is_solvable(board, tables.goal):
+        return None
+    return load_table(tables.width, goal_blank=tables.goal_blank)[rank_board(board)]
+
+# Resuelve por descenso voraz sobre la tabla: en cada paso elige un vecino con distancia exactamente uno menor.
+# No hay búsqueda; el costo es proporcional a la longitud del camino y la solución es óptima.
+# goal funciona como en los solucionadores de model.py: se desciende en el marco canónico y el camino se reetiqueta.
+@instrumented
+def solve_table(start_board, stats=None, cancel=None, goal=None):
+    start_board, tables, labels = goal_frame(start_board, goal)
+    remaining = distance(start_board, tables.goal)
+    if remaining is None:
+        record_stats(stats, 0, 0)
+        return None
+    table = load_table(tables.width, goal_blank=tables.goal_blank)
+    moves = tables.moves
+    board = start_board[:]
+    codes = [encode_board(board)]
+    generated = 0
+
+    while remaining:
+        blank = board.index(0)
+        for _, new_blank in moves[blank]:
+            child = board[:]
+            child[blank], child[new_blank] = child[new_blank], 0
+            generated += 1
+            if table[rank_board(child)] == remaining - 1:
+                board = child
+                break
+        remaining -= 1
+        codes.append(encode_board(board))
+        checkpoint(stats, cancel, len(codes) - 1, generated)
+
+    record_stats(stats, len(codes) - 1, generated, peak_frontier=1)
+    return path_from_codes(codes, tables, labels)
+
+# Genera la tabla desde consola (py lookup_table.py).
+# Con --depth escribe tableros a esa distancia exacta, uno por línea (formato de entrada de batch.py).
+def main():
+    parser = argparse.ArgumentParser(description="Genera la tabla perfecta de distancias del puzzle 8.")
+    parser.add_argument("--force", action="store_true", help="Regenera la tabla aunque ya exista.")
+    parser.add_argument("--depth", type=int, help="Escribe tableros a esta distancia óptima en lugar de generar la tabla.")
+    parser.add_argument("--count", type=int, default=10, help="Tableros a escribir con --depth.")
+    parser.add_argument("--seed", type=int, help="Semilla para repetir la misma muestra.")
+    args = parser.parse_args()
+
+    if args.depth is not None:
+        rng = random.Random(args.seed)
+        for _ in range(args.count):
+            print(" ".join(str(tile) for tile in random_board_at_depth(args.depth, rng=rng)))
+        return
+
+    path = table_path()
+    if os.path.exists(path) and not args.force:
+        print(f"{path}: ya existe.")
+        return
+    started = time.perf_counter()
+    distances = build_table()
+    save_pattern(path, distances)
+    print(f"{path}: {len(distances)} bytes, distancia máxima {max(distances)}, en {time.perf_counter() - started:.1f} s.")
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,21 @@
 #Importaciones para interfaces, vista y controlador.
 # Autor: Espinoza Felix Fausto Gabriel.
 # Fecha: 2025-8-31.
+import sys
 import tkinter as tk   
 from view import PuzzleView
 from controller import PuzzleController
 
 def main():
+    #Tamaño opcional del tablero por consola (py main.py 4 para el puzzle 15).
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    #Objetivo opcional separado por comas (py main.py 3 1,2,3,8,0,4,7,6,5 para el objetivo en espiral).
+    goal = [int(value) for value in sys.argv[2].split(",")] if len(sys.argv) > 2 else None
+
     #Creacion de la ventana principal, Conectando vista y controlador.
     root = tk.Tk()
-    view = PuzzleView(root)
-    controller = PuzzleController(view)
+    view = PuzzleView(root, size=size)
+    controller = PuzzleController(view, size, goal)
     view.set_controller(controller)
     root.mainloop()
 
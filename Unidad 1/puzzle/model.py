@@ -1,87 +1,970 @@
-#Implementación del algoritmo A* para resolver el Puzzle 8.
+#Implementación de los algoritmos A* e IDA* para resolver el Puzzle 8 (y tableros N x N).
 # Autor: Espinoza Felix Fausto Gabriel.
 # Fecha: 2025-8-31.
+import collections
+import functools
 import heapq
+import math
+import random
+import threading
+import time
+import tracemalloc
+
+# Representación compacta: cada casilla ocupa BITS bits dentro de un solo entero.
+# 4 bits alcanzan hasta el puzzle 15; tableros más grandes usan los bits necesarios para su ficha mayor.
+WIDTH = 3
+
+# Ancho máximo con g-costos en arreglos indexados por rango: 9! = 362,880 bytes en el puzzle 8 (16! ya no cabe).
+RANKED_WIDTH = 3
+
+# Tablas precalculadas de un tamaño de tablero: objetivo, vecinos por posición del blanco y distancias Manhattan.
+# goal es el tablero objetivo (por defecto el estándar, con el blanco al final).
+class PuzzleTables:
+
+    def __init__(self, width, goal=None):
+        self.width = width
+        self.cells = width * width
+        self.bits = _bits_for(self.cells)
+        self.mask = (1 << self.bits) - 1
+        self.goal = goal_board(width) if goal is None else list(goal)
+        self.goal_blank = self.goal.index(0)
+        self.goal_code = encode_board(self.goal)
+        self.moves = _build_move_table(width)
+        self.manhattan = _build_manhattan_table(width, self.goal)
+        self.ranked_moves = _build_ranked_moves(width, self.bits) if width <= RANKED_WIDTH else None
+
+_TABLES = {}
+
+# Devuelve (y memoriza) las tablas para un tablero de width x width.
+# goal_blank elige el objetivo canónico con el blanco en esa casilla (ver goal_board); por defecto, la última.
+def get_tables(width, goal_blank=None):
+    key = (width, width * width - 1 if goal_blank is None else goal_blank)
+    tables = _TABLES.get(key)
+    if tables is None:
+        tables = _TABLES[key] = PuzzleTables(width, goal_board(width, key[1]))
+    return tables
+
+# Tablero objetivo de un puzzle width x width: fichas en orden y el blanco al final (o en la casilla blank).
+# Con el blanco en otra casilla es el objetivo canónico de esa casilla: las fichas siguen en orden saltándola.
+def goal_board(width, blank=None):
+    board = list(range(1, width * width))
+    board.insert(width * width - 1 if blank is None else blank, 0)
+    return board
+
+# Calcula el ancho de un tablero cuadrado a partir de su número de casillas.
+def board_width(board):
+    width = math.isqrt(len(board))
+    if width < 2 or width * width != len(board):
+        raise ValueError(f"El tablero debe ser cuadrado (N x N), tiene {len(board)} casillas.")
+    return width
+
+# Bits por casilla necesarios para un tablero con el número de casillas dado.
+def _bits_for(cells):
+    return max(4, (cells - 1).bit_length())
+
+# Nombre del movimiento según el desplazamiento del espacio en blanco.
+def _move_name(step, width):
+    if step == -width:
+        return "arriba"
+    if step == width:
+        return "abajo"
+    return "izquierda" if step == -1 else "derecha"
+
+# Construye la tabla de vecinos: para cada posición del blanco, las casillas a las que puede moverse.
+def _build_move_table(width):
+    table = []
+    for blank in range(width * width):
+        row, col = divmod(blank, width)
+        targets = []
+        if row > 0:
+            targets.append(("arriba", blank - width))
+        if row < width - 1:
+            targets.append(("abajo", blank + width))
+        if col > 0:
+            targets.append(("izquierda", blank - 1))
+        if col < width - 1:
+            targets.append(("derecha", blank + 1))
+        table.append(tuple(targets))
+    return tuple(table)
+
+# Rango de Lehmer de la posición de cada ficha (posiciones[0] es el blanco): índice en [0, cells!).
+# Se usa la permutación inversa porque un movimiento solo intercambia dos de sus valores y el rango
+# se puede actualizar con las fichas que quedan entre el blanco y la ficha movida (ver _build_ranked_moves).
+def _position_rank(board):
+    positions = [0] * len(board)
+    for pos, tile in enumerate(board):
+        positions[tile] = pos
+    return _permutation_rank(positions)
+
+# Tabla de vecinos con lo necesario para actualizar _position_rank en O(ancho):
+# ranked_moves[blanco] = ((nuevo_blanco, base, signo, desplazamientos de las casillas intermedias), ...).
+# Al mover el blanco de a a b, su dígito de Lehmer (que es su posición) cambia en b - a; cada ficha intermedia menor
+# que la movida cambia su propio dígito en signo, y cada una mayor cambia el de la ficha movida en -signo.
+# El rango del hijo es rango + signo * (base + suma de weights[menor] - suma de weights[movida]).
+def _build_ranked_moves(width, bits):
+    cells = width * width
+    table = []
+    for blank, targets in enumerate(_build_move_table(width)):
+        entries = []
+        for _, new_blank in targets:
+            low, high = sorted((blank, new_blank))
+            sign = 1 if new_blank > blank else -1
+            between = tuple(pos * bits for pos in range(low + 1, high))
+            entries.append((new_blank, math.factorial(cells - 1) * (high - low), sign, between))
+        table.append(tuple(entries))
+    return tuple(table)
+
+# Peso de Lehmer de cada ficha en _position_rank: (cells - 1 - ficha)!.
+def _rank_weights(cells):
+    return [math.factorial(cells - 1 - tile) for tile in range(cells)]
+
+# Construye la tabla de distancias Manhattan: manhattan[ficha][posición].
+def _build_manhattan_table(width, goal):
+    table = [[0] * (width * width) for _ in range(width * width)]
+    for tile in goal:
+        if tile == 0:
+            continue
+        target_row, target_col = divmod(goal.index(tile), width)
+        for pos in range(width * width):
+            row, col = divmod(pos, width)
+            table[tile][pos] = abs(target_row - row) + abs(target_col - col)
+    return table
+
+# Empaqueta un tablero (lista) en un entero.
+def encode_board(board):
+    bits = _bits_for(len(board))
+    code = 0
+    for i, value in enumerate(board):
+        code |= value << (i * bits)
+    return code
+
+# Desempaqueta un entero en la lista del tablero.
+def decode_board(code, cells=WIDTH * WIDTH):
+    bits = _bits_for(cells)
+    mask = (1 << bits) - 1
+    return [(code >> (i * bits)) & mask for i in range(cells)]
+
+# Paridad (0 par, 1 impar) de las inversiones de una secuencia de fichas 1..m.
+# Se obtiene en O(m) por descomposición en ciclos: paridad = (m - ciclos) % 2.
+def _permutation_parity(tiles):
+    visited = [False] * len(tiles)
+    cycles = 0
+    for start in range(len(tiles)):
+        if visited[start]:
+            continue
+        cycles += 1
+        i = start
+        while not visited[i]:
+            visited[i] = True
+            i = tiles[i] - 1
+    return (len(tiles) - cycles) % 2
+
+# Paridad de inversiones que tienen los tableros alcanzables desde el objetivo con el blanco en la posición dada.
+# En anchos impares siempre es par; en anchos pares cambia con cada fila que se aleja el blanco de la fila
+# del blanco del objetivo canónico (goal_blank; por defecto, la última casilla).
+def _goal_parity(width, blank, goal_blank=None):
+    if width % 2:
+        return 0
+    goal_row = width - 1 if goal_blank is None else goal_blank // width
+    return (goal_row - blank // width) % 2
+
+# Comprueba que un tablero de width x width contenga cada valor de 0 a cells - 1 una sola vez.
+def _check_permutation(board, width):
+    if len(board) != width * width or sorted(board) != list(range(width * width)):
+        raise ValueError(f"El tablero debe contener cada valor de 0 a {width * width - 1} una sola vez.")
+
+# Indica si un tablero N x N puede llevarse al objetivo, comparando la paridad de inversiones con la del objetivo.
+# Evita que A*/IDA* recorran la mitad del espacio de estados (o no terminen) con tableros imposibles.
+# goal es opcional (cualquier disposición); el tablero se compara en el marco canónico de ese objetivo.
+def is_solvable(board, goal=None):
+    width = board_width(board)
+    _check_permutation(board, width)
+    goal_blank = None
+    if goal is not None:
+        board = relabel_board(board, goal)
+        goal_blank = goal.index(0)
+    return _permutation_parity([tile for tile in board if tile]) == _goal_parity(width, board.index(0), goal_blank)
+
+# Etiquetas para pasar del objetivo goal a su objetivo canónico (mismo blanco, fichas en orden) y de vuelta:
+# to_canonical[ficha] y from_canonical[ficha canónica]. Las dos dejan el blanco en 0.
+def _label_maps(goal):
+    width = board_width(goal)
+    _check_permutation(goal, width)
+    canonical = goal_board(width, goal.index(0))
+    to_canonical = [0] * len(goal)
+    from_canonical = [0] * len(goal)
+    for tile, label in zip(goal, canonical):
+        to_canonical[tile] = label
+        from_canonical[label] = tile
+    return to_canonical, from_canonical
+
+# Reetiqueta un tablero para que el objetivo goal pase a ser su objetivo canónico.
+# Así un mismo objetivo canónico (y sus tablas: PDB, tabla perfecta, walking distance) sirve para cualquier
+# disposición con el blanco en la misma casilla; solo cambian los nombres de las fichas.
+def relabel_board(board, goal):
+    if len(board) != len(goal):
+        raise ValueError("El tablero y el objetivo deben tener el mismo tamaño.")
+    to_canonical, _ = _label_maps(goal)
+    _check_permutation(board, board_width(board))
+    return [to_canonical[tile] for tile in board]
+
+# Prepara una búsqueda hacia goal (None: el objetivo estándar): devuelve el tablero inicial en el marco canónico,
+# las tablas de ese objetivo canónico y las etiquetas para devolver el camino al marco original (None si no hace falta).
+# Comprueba también que la heurística (si indica goal_blank) sea del mismo objetivo canónico.
+def goal_frame(board, goal, heuristic=None):
+    width = board_width(board)
+    if goal is None or list(goal) == goal_board(width):
+        tables, labels = get_tables(width), None
+    else:
+        board = relabel_board(board, goal)
+        tables, labels = get_tables(width, goal.index(0)), _label_maps(goal)[1]
+    if getattr(heuristic, "goal_blank", tables.goal_blank) != tables.goal_blank:
+        raise ValueError("La heurística es de otro objetivo (créala con el mismo goal que la búsqueda).")
+    return board, tables, labels
+
+# Rango de Lehmer de una permutación de 0..m-1.
+def _permutation_rank(values):
+    rank = 0
+    used = 0
+    m = len(values)
+    for i, value in enumerate(values):
+        smaller_unused = value - bin(used & ((1 << value) - 1)).count("1")
+        rank = rank * (m - i) + smaller_unused
+        used |= 1 << value
+    return rank
+
+# Permutación de 0..m-1 con el rango de Lehmer dado.
+def _permutation_unrank(rank, m):
+    digits = []
+    for radix in range(1, m + 1):
+        rank, digit = divmod(rank, radix)
+        digits.append(digit)
+    available = list(range(m))
+    return [available.pop(digit) for digit in reversed(digits)]
+
+# Número de tableros alcanzables de un puzzle width x width (la mitad de las permutaciones).
+def state_count(width):
+    return math.factorial(width * width) // 2
+
+# Índice perfecto de un tablero solucionable en [0, state_count(width)):
+# posición del blanco * (n-1)!/2 + rango de Lehmer de las fichas // 2.
+# Dentro de cada posición del blanco solo hay una paridad alcanzable, y las dos permutaciones que difieren
+# en el orden de las dos últimas fichas tienen paridades opuestas, así que dividir entre 2 no produce choques.
+def rank_board(board):
+    blank = board.index(0)
+    tiles = [value - 1 for value in board if value]
+    return blank * (math.factorial(len(tiles)) // 2) + _permutation_rank(tiles) // 2
+
+# Tablero solucionable de ancho width con el índice dado (inverso de rank_board).
+# goal_blank elige el objetivo canónico; en anchos impares todos comparten la misma mitad de tableros.
+def unrank_board(index, width, goal_blank=None):
+    cells = width * width
+    blank, rank = divmod(index, math.factorial(cells - 1) // 2)
+    tiles = [tile + 1 for tile in _permutation_unrank(rank * 2, cells - 1)]
+    if _permutation_parity(tiles) != _goal_parity(width, blank, goal_blank):
+        tiles[-2], tiles[-1] = tiles[-1], tiles[-2]
+    tiles.insert(blank, 0)
+    return tiles
+
+# Tablero solucionable elegido uniformemente al azar entre todos los alcanzables (sin simular movimientos).
+# Con goal, el tablero es alcanzable desde ese objetivo y usa sus mismas fichas.
+def random_solvable_board(width=WIDTH, rng=random, goal=None):
+    if goal is None:
+        return unrank_board(rng.randrange(state_count(width)), width)
+    if len(goal) != width * width:
+        raise ValueError(f"El objetivo debe tener {width * width} casillas.")
+    _, from_canonical = _label_maps(goal)
+    board = unrank_board(rng.randrange(state_count(width)), width, goal.index(0))
+    return [from_canonical[tile] for tile in board]
 
 class PuzzleState:
+    __slots__ = ("board", "parent", "move", "cost", "blank", "h", "f", "tables", "evaluator")
 
-    # Inicializa un estado del puzzle.
-    def __init__(self, board, parent=None, move=None, cost=0):
+    # Inicializa un estado del puzzle; el tamaño (N x N) se deduce del tablero.
+    # heuristic es opcional (cualquier objeto con evaluate/update); sin ella se usa Manhattan.
+    # goal es opcional: con una disposición propia, is_goal y Manhattan se calculan respecto a ella
+    # (las demás heurísticas trabajan en el marco canónico, así que solo se admiten con el objetivo estándar).
+    def __init__(self, board, parent=None, move=None, cost=0, heuristic=None, goal=None):
         self.board = board[:]               # Copia defensiva del tablero.
         self.parent = parent                # Estado anterior.
         self.move = move                    # Movimiento que llevó a este estado.
         self.cost = cost                    # Costo acumulado (g).
         self.blank = self.board.index(0)    # Posición del espacio en blanco.
+        width = board_width(self.board)
+        if goal is None or list(goal) == goal_board(width):
+            self.tables = get_tables(width)
+        elif heuristic is not None:
+            raise ValueError("Con un objetivo propio PuzzleState solo usa Manhattan; para otras heurísticas usa los solucionadores con goal=.")
+        else:
+            self.tables = _custom_tables(goal)
+        self.evaluator = heuristic          # Heurística que comparten todos los estados de la búsqueda.
+        if heuristic is None:
+            self.h = manhattan_distance(self.board, self.tables)  # Heurística calculada una sola vez (h).
+        else:
+            self.h = heuristic.evaluate(self.board)
+        self.f = cost + self.h                                    # Prioridad en caché (f = g + h).
 
     # Verifica si el estado actual es el objetivo.
     def is_goal(self):
-        return self.board == [1, 2, 3, 4, 5, 6, 7, 8, 0]
+        return self.board == self.tables.goal
 
     # Genera todos los estados vecinos moviendo el espacio en blanco.
     def get_neighbors(self):
-        
-        neighbors = []
-        moves = {"arriba": -3, "abajo": 3, "izquierda": -1, "derecha": 1}
-        
-        for move, step in moves.items():
-            new_blank = self.blank + step
-            
-            # Validaciones de límites y bordes del tablero.
-            if new_blank < 0 or new_blank >= 9:
-                continue
-            if self.blank % 3 == 0 and move == "izquierda":
-                continue
-            if self.blank % 3 == 2 and move == "derecha":
-                continue
-            
-            new_board = self.board[:]                                                                   # Copia del tablero actual.
-            new_board[self.blank], new_board[new_blank] = new_board[new_blank], new_board[self.blank]   # Intercambia el espacio en blanco con la ficha adyacente.
-            neighbors.append(PuzzleState(new_board, self, move, self.cost + 1))                         # Crea un nuevo estado vecino y lo añade a la lista.
+        return [self._child(move, new_blank) for move, new_blank in self.tables.moves[self.blank]]
 
-        return neighbors
+    # Crea el vecino que resulta de mover el blanco a new_blank, actualizando h por diferencia.
+    # Solo la ficha desplazada cambia de posición, así que no hace falta recorrer todo el tablero.
+    def _child(self, move, new_blank):
+        board = self.board[:]
+        tile = board[new_blank]
+        board[self.blank], board[new_blank] = tile, 0   # Intercambia el espacio en blanco con la ficha adyacente.
+        manhattan = self.tables.manhattan
 
-    # Calcula la heurística usando distancia de Manhattan.
+        child = PuzzleState.__new__(PuzzleState)
+        child.board = board
+        child.parent = self
+        child.move = move
+        child.cost = self.cost + 1
+        child.blank = new_blank
+        child.tables = self.tables
+        child.evaluator = self.evaluator
+        if self.evaluator is None:
+            child.h = self.h + manhattan[tile][self.blank] - manhattan[tile][new_blank]
+        else:
+            child.h = self.evaluator.update(self.h, encode_board(board), tile, new_blank, self.blank)
+        child.f = child.cost + child.h
+        return child
+
+    # Devuelve la heurística guardada en el estado (Manhattan salvo que se haya pasado otra).
     def heuristic(self):
-        distance = 0
-        for i, value in enumerate(self.board):
-            if value == 0:
-                continue
-            target_x, target_y = (value - 1) % 3, (value - 1) // 3  #Posición objetivo.
-            current_x, current_y = i % 3, i // 3                    #Posición actual.
-            distance += abs(target_x - current_x) + abs(target_y - current_y)
-            
-        return distance
+        return self.h
 
     # Comparación basada en f = g + h para la cola de prioridad (f = CTE, g = CR, h = ECR).
-    def __lt__(self, other): 
-        return (self.cost + self.heuristic()) < (other.cost + other.heuristic())
+    def __lt__(self, other):
+        return self.f < other.f
+
+_CUSTOM_TABLES = {}
+
+# Tablas (objetivo y Manhattan) de una disposición objetivo arbitraria, para PuzzleState.
+def _custom_tables(goal):
+    key = tuple(goal)
+    if key not in _CUSTOM_TABLES:
+        width = board_width(goal)
+        _check_permutation(goal, width)
+        _CUSTOM_TABLES[key] = PuzzleTables(width, goal)
+    return _CUSTOM_TABLES[key]
+
+# Calcula la distancia de Manhattan completa de un tablero usando la tabla precalculada.
+def manhattan_distance(board, tables=None):
+    manhattan = (tables or get_tables(board_width(board))).manhattan
+    return sum(manhattan[value][i] for i, value in enumerate(board) if value)
+
+# Heurística de Manhattan como objeto intercambiable.
+# Los solucionadores aceptan cualquier heurística con esta misma interfaz (ver heuristics.py):
+#   evaluate(board)                   -> h completa de un tablero.
+#   update(h, code, tile, src, dst)   -> h del hijo (code) tras mover tile de src a dst.
+# Con goal, la heurística es la del objetivo canónico con el mismo blanco (el marco en que buscan los solucionadores).
+class ManhattanHeuristic:
+
+    def __init__(self, width, goal=None):
+        self.tables = get_tables(width, None if goal is None else goal.index(0))
+        self.goal_blank = self.tables.goal_blank
+
+    def evaluate(self, board):
+        return manhattan_distance(board, self.tables)
+
+    def update(self, h, code, tile, src, dst):
+        manhattan = self.tables.manhattan
+        return h + manhattan[tile][dst] - manhattan[tile][src]
+
+# Estadísticas de una ejecución de un solucionador (se pasa como stats= y el solucionador la rellena).
+# Con track_memory=True también mide el pico de memoria con tracemalloc (hace la búsqueda más lenta).
+class SolverStats:
+
+    def __init__(self, track_memory=False):
+        self.track_memory = track_memory
+        self.expanded = 0       # Nodos expandidos.
+        self.generated = 0      # Nodos generados (añadidos a la frontera).
+        self.duplicates = 0     # Hijos descartados por haberse alcanzado ya con un costo igual o menor.
+        self.peak_frontier = 0  # Tamaño máximo de la frontera (en IDA*, la profundidad máxima del camino).
+        self.closed_size = 0    # Estados guardados en best_cost al terminar.
+        self.elapsed = 0.0      # Tiempo de reloj en segundos.
+        self.peak_memory = None # Pico de memoria en bytes (solo con track_memory).
+        self.bound = None       # Cota de suboptimalidad de la solución (solo en anytime_a_star; 1.0 es óptima).
+
+    # Devuelve las estadísticas como diccionario (para JSON).
+    def as_dict(self):
+        return {key: value for key, value in vars(self).items() if key != "track_memory"}
+
+    # Resumen corto para mostrar en la interfaz.
+    def summary(self):
+        text = (f"{self.expanded:,} expandidos, {self.generated:,} generados, "
+                f"frontera máx. {self.peak_frontier:,}, {self.elapsed:.3f} s")
+        if self.peak_memory is not None:
+            text += f", {self.peak_memory / 1048576:.1f} MB"
+        if self.bound is not None:
+            text += f", a lo más {self.bound:.2f} veces el óptimo"
+        return text
+
+# Caché LRU de soluciones óptimas, compartible entre búsquedas del mismo tamaño de tablero.
+# Por cada tablero empaquetado guarda el siguiente tablero de un camino óptimo; al encontrar una solución se guardan
+# todos sus estados intermedios, y una búsqueda posterior que alcance cualquiera de ellos ya conoce el resto.
+# Al llenarse se descartan primero los estados usados hace más tiempo (los más lejanos al objetivo de cada camino).
+# Guarda caminos en el marco canónico, así que sirve para cualquier goal con el blanco en la misma casilla.
+class SolutionCache:
+
+    def __init__(self, width=WIDTH, capacity=100000, goal=None):
+        if capacity < 1:
+            raise ValueError("La capacidad de la caché debe ser al menos 1.")
+        self.width = width
+        self.goal_code = get_tables(width, None if goal is None else goal.index(0)).goal_code
+        self.capacity = capacity
+        self.hits = 0
+        self._entries = collections.OrderedDict()  # Código -> código siguiente (None en el objetivo).
+        self._lock = threading.Lock()     # La interfaz y su hilo de búsqueda pueden usarla a la vez.
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, code):
+        return code in self._entries
+
+    # Devuelve los códigos del camino guardado desde code hasta el objetivo, o None si no está.
+    # Si al descartar entradas el camino quedó incompleto, se borra lo que ya no lleva al objetivo.
+    def remainder(self, code):
+        if code not in self._entries:
+            return None
+        entries = self._entries
+        chain = []
+        with self._lock:
+            while code is not None:
+                if code not in entries:
+                    for broken in chain:
+                        entries.pop(broken, None)
+                    return None
+                entries.move_to_end(code)
+                chain.append(code)
+                code = entries[code]
+            self.hits += 1
+        return chain
+
+    # Guarda un camino óptimo completo (códigos del inicial al objetivo).
+    def store(self, codes):
+        if not codes or codes[-1] != self.goal_code:
+            raise ValueError("El camino no termina en el objetivo de la caché.")
+        entries = self._entries
+        with self._lock:
+            for code, next_code in zip(codes, codes[1:] + [None]):
+                entries[code] = next_code
+                entries.move_to_end(code)
+            while len(entries) > self.capacity:
+                entries.popitem(last=False)
+
+    # Vacía la caché.
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+        self.hits = 0
+
+# Comprueba que la caché sea del mismo objetivo que la búsqueda y devuelve su función de consulta (None sin caché).
+def _cache_lookup(cache, tables):
+    if cache is None:
+        return None
+    if cache.width != tables.width:
+        raise ValueError(f"La caché de soluciones es de tableros {cache.width}x{cache.width}; "
+                         f"el tablero es {tables.width}x{tables.width}.")
+    if cache.goal_code != tables.goal_code:
+        raise ValueError("La caché de soluciones es de otro objetivo (créala con el mismo goal que la búsqueda).")
+    return cache.remainder
+
+# Envuelve un solucionador para medir el tiempo (y la memoria, si se pidió) de forma uniforme,
+# incluso cuando la búsqueda termina por cancelación.
+def instrumented(solver):
+    @functools.wraps(solver)
+    def wrapper(start_board, *args, stats=None, **kwargs):
+        if stats is None:
+            return solver(start_board, *args, **kwargs)
+        owns_tracing = stats.track_memory and not tracemalloc.is_tracing()
+        if owns_tracing:
+            tracemalloc.start()
+        elif stats.track_memory and hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        started = time.perf_counter()
+        try:
+            return solver(start_board, *args, stats=stats, **kwargs)
+        finally:
+            stats.elapsed = time.perf_counter() - started
+            if stats.track_memory:
+                stats.peak_memory = tracemalloc.get_traced_memory()[1]
+                if owns_tracing:
+                    tracemalloc.stop()
+    return wrapper
+
+# Se lanza cuando se cancela una búsqueda en curso (cancel.set() desde otro hilo).
+class SearchCancelled(Exception):
+    pass
+
+# Cada cuántas expansiones se publica el progreso y se revisa la cancelación.
+CHECK_INTERVAL = 1024
+
+# Publica el progreso parcial en stats y detiene la búsqueda si se pidió cancelar.
+# cancel es cualquier objeto con is_set(), normalmente un threading.Event.
+def checkpoint(stats, cancel, expanded, generated):
+    if stats is not None:
+        stats.expanded = expanded
+        stats.generated = generated
+    if cancel is not None and cancel.is_set():
+        raise SearchCancelled()
+
+# Guarda los contadores finales en stats, si se pidió (extra: duplicates, peak_frontier, closed_size).
+def record_stats(stats, expanded, generated, **extra):
+    if stats is not None:
+        stats.expanded = expanded
+        stats.generated = generated
+        for name, value in extra.items():
+            setattr(stats, name, value)
 
 # Algoritmo A* para encontrar la solución del puzzle.
-def a_star(start_board):
-    start_state = PuzzleState(start_board)
-    frontier = []
+# Trabaja sobre tableros empaquetados y la tabla de vecinos precalculada; los padres se guardan como códigos enteros.
+# heuristic es opcional (p. ej. una PatternDatabase); sin ella se usa Manhattan calculada en línea.
+# stats recibe el progreso durante la búsqueda y cancel permite detenerla (lanza SearchCancelled).
+# Con cache (SolutionCache), un estado con solución guardada entra a la frontera con su distancia exacta como h
+# y la búsqueda termina al sacarlo; el camino encontrado se guarda en la caché.
+# goal (opcional, igual en todos los solucionadores) es una disposición objetivo propia: el tablero se reetiqueta
+# al objetivo estándar con el blanco en la misma casilla (goal_frame), se busca con sus tablas y el camino se
+# devuelve con las fichas originales. La heurística y la caché deben crearse con el mismo goal.
+@instrumented
+def a_star(start_board, heuristic=None, stats=None, cancel=None, cache=None, goal=None):
+    start_board, tables, labels = goal_frame(start_board, goal, heuristic)
+    if not is_solvable(start_board, tables.goal):
+        record_stats(stats, 0, 0)
+        return None
+    if tables.ranked_moves is not None:
+        return _ranked_a_star(start_board, tables, labels, heuristic, stats, cancel, cache)
+    bits, mask, moves, manhattan = tables.bits, tables.mask, tables.moves, tables.manhattan
+    update = heuristic.update if heuristic else None
+    lookup = _cache_lookup(cache, tables)
+    exits = {}  # Código -> resto del camino guardado en la caché.
+    start = encode_board(start_board)
+    goal = tables.goal_code
+    start_h = heuristic.evaluate(start_board) if heuristic else manhattan_distance(start_board, tables)
+    rest = lookup(start) if lookup is not None else None
+    if rest is not None:
+        exits[start] = rest
+        start_h = len(rest) - 1
+    frontier = [(start_h, 0, start, start_board.index(0), 0)]  # (f, contador, código, blanco, g).
+    best_cost = {start: 0}
+    parents = {start: None}
     counter = 0
-    start_f = start_state.cost + start_state.heuristic()
-    heapq.heappush(frontier, (start_f, counter, start_state))
-    best_cost = {tuple(start_state.board): 0}
-        
+    expanded = duplicates = peak_frontier = 0
+
     while frontier:
-        _, _, current = heapq.heappop(frontier)
-
-        if current.is_goal():
-            return reconstruct_path(current)
-            
-        for neighbor in current.get_neighbors():
-            key = tuple(neighbor.board)
-            g = neighbor.cost
-            if key not in best_cost or g < best_cost[key]:
-                best_cost[key] = g
+        f, _, code, blank, g = heapq.heappop(frontier)
+
+        if code == goal or code in exits:
+            record_stats(stats, expanded, counter, duplicates=duplicates,
+                         peak_frontier=peak_frontier, closed_size=len(best_cost))
+            codes = _rebuild_codes(parents, code) + exits.get(code, [code])[1:]
+            if cache is not None:
+                cache.store(codes)
+            return path_from_codes(codes, tables, labels)
+        if g > best_cost[code]:
+            continue    # Entrada obsoleta: ya se encontró un camino más corto a este estado.
+
+        expanded += 1
+        if not expanded % CHECK_INTERVAL:
+            checkpoint(stats, cancel, expanded, counter)
+        h = f - g
+        child_g = g + 1
+        blank_shift = blank * bits
+        for _, new_blank in moves[blank]:
+            shift = new_blank * bits
+            tile = (code >> shift) & mask
+            child = code ^ (tile << shift) | (tile << blank_shift)   # Desliza la ficha hacia el blanco.
+            if child_g < best_cost.get(child, child_g + 1):
+                best_cost[child] = child_g
+                parents[child] = code
                 counter += 1
-                f = g + neighbor.heuristic()
-                heapq.heappush(frontier, (f, counter, neighbor))
+                if update is None:
+                    child_h = h + manhattan[tile][blank] - manhattan[tile][new_blank]   # Solo cambia la ficha movida.
+                else:
+                    child_h = update(h, child, tile, new_blank, blank)
+                if lookup is not None:
+                    rest = lookup(child)
+                    if rest is not None:
+                        exits[child] = rest
+                        child_h = len(rest) - 1     # Distancia exacta: al sacarlo de la frontera ya no hace falta buscar.
+                heapq.heappush(frontier, (child_g + child_h, counter, child, new_blank, child_g))
+            else:
+                duplicates += 1
+        if len(frontier) > peak_frontier:
+            peak_frontier = len(frontier)
+
+    record_stats(stats, expanded, counter, duplicates=duplicates,
+                 peak_frontier=peak_frontier, closed_size=len(best_cost))
+    return None
+
+UNSEEN = 255    # g-costo de un rango todavía no alcanzado en _ranked_a_star.
+
+# A* para tableros pequeños (hasta RANKED_WIDTH): los g-costos se guardan en un bytearray de tamaño fijo
+# indexado por _position_rank en lugar de un diccionario, y el rango de cada hijo se obtiene del padre en O(ancho).
+# No hace falta guardar padres: el camino se recupera desde los mismos g-costos (ver _rebuild_ranked_codes).
+def _ranked_a_star(start_board, tables, labels, heuristic, stats, cancel, cache):
+    bits, mask, manhattan, ranked_moves = tables.bits, tables.mask, tables.manhattan, tables.ranked_moves
+    weights = _rank_weights(tables.cells)
+    update = heuristic.update if heuristic else None
+    lookup = _cache_lookup(cache, tables)
+    exits = {}  # Código -> resto del camino guardado en la caché.
+    start = encode_board(start_board)
+    start_rank = _position_rank(start_board)
+    goal = tables.goal_code
+    start_h = heuristic.evaluate(start_board) if heuristic else manhattan_distance(start_board, tables)
+    rest = lookup(start) if lookup is not None else None
+    if rest is not None:
+        exits[start] = rest
+        start_h = len(rest) - 1
+    frontier = [(start_h, 0, start, start_board.index(0), 0, start_rank)]  # (f, contador, código, blanco, g, rango).
+    best_cost = bytearray([UNSEEN]) * math.factorial(tables.cells)
+    best_cost[start_rank] = 0
+    closed_size = 1
+    counter = 0
+    expanded = duplicates = peak_frontier = 0
+
+    while frontier:
+        f, _, code, blank, g, rank = heapq.heappop(frontier)
+
+        if code == goal or code in exits:
+            record_stats(stats, expanded, counter, duplicates=duplicates,
+                         peak_frontier=peak_frontier, closed_size=closed_size)
+            codes = _rebuild_ranked_codes(best_cost, code, blank, rank, tables, weights) + exits.get(code, [code])[1:]
+            if cache is not None:
+                cache.store(codes)
+            return path_from_codes(codes, tables, labels)
+        if g > best_cost[rank]:
+            continue    # Entrada obsoleta: ya se encontró un camino más corto a este estado.
+
+        expanded += 1
+        if not expanded % CHECK_INTERVAL:
+            checkpoint(stats, cancel, expanded, counter)
+        h = f - g
+        child_g = g + 1
+        blank_shift = blank * bits
+        for new_blank, delta, sign, between in ranked_moves[blank]:
+            shift = new_blank * bits
+            tile = (code >> shift) & mask
+            for other_shift in between:
+                other = (code >> other_shift) & mask
+                delta += weights[other] if other < tile else -weights[tile]
+            child_rank = rank + sign * delta
+            if child_g < best_cost[child_rank]:
+                if best_cost[child_rank] == UNSEEN:
+                    closed_size += 1
+                best_cost[child_rank] = child_g
+                child = code ^ (tile << shift) | (tile << blank_shift)   # Desliza la ficha hacia el blanco.
+                counter += 1
+                if update is None:
+                    child_h = h + manhattan[tile][blank] - manhattan[tile][new_blank]   # Solo cambia la ficha movida.
+                else:
+                    child_h = update(h, child, tile, new_blank, blank)
+                if lookup is not None:
+                    rest = lookup(child)
+                    if rest is not None:
+                        exits[child] = rest
+                        child_h = len(rest) - 1
+                heapq.heappush(frontier, (child_g + child_h, counter, child, new_blank, child_g, child_rank))
+            else:
+                duplicates += 1
+        if len(frontier) > peak_frontier:
+            peak_frontier = len(frontier)
+
+    record_stats(stats, expanded, counter, duplicates=duplicates,
+                 peak_frontier=peak_frontier, closed_size=closed_size)
+    return None
+
+# Reconstruye los códigos del camino de _ranked_a_star retrocediendo desde code hasta el inicial.
+# Todo estado alcanzado con costo g > 0 tiene un vecino con costo guardado menor que g (el que lo generó, o uno mejor),
+# y solo el inicial tiene costo 0; como A* ya garantizó que g es óptimo, el camino recorrido también lo es.
+def _rebuild_ranked_codes(best_cost, code, blank, rank, tables, weights):
+    bits, mask = tables.bits, tables.mask
+    codes = [code]
+    while best_cost[rank]:
+        for new_blank, delta, sign, between in tables.ranked_moves[blank]:
+            shift = new_blank * bits
+            tile = (code >> shift) & mask
+            for other_shift in between:
+                other = (code >> other_shift) & mask
+                delta += weights[other] if other < tile else -weights[tile]
+            if best_cost[rank + sign * delta] < best_cost[rank]:
+                break
+        rank += sign * delta
+        code = code ^ (tile << shift) | (tile << blank * bits)
+        blank = new_blank
+        codes.append(code)
+    codes.reverse()
+    return codes
+
+# Algoritmo IDA*: búsqueda en profundidad con cota f creciente.
+# Solo guarda el camino actual, por lo que la memoria es lineal en la longitud de la solución;
+# es la opción para tableros de 4x4 o mayores, donde A* agota la memoria.
+# Con cache, un estado con solución guardada se trata como hoja de costo exacto, igual que en a_star.
+@instrumented
+def ida_star(start_board, heuristic=None, stats=None, cancel=None, cache=None, goal=None):
+    start_board, tables, labels = goal_frame(start_board, goal, heuristic)
+    if not is_solvable(start_board, tables.goal):
+        record_stats(stats, 0, 0)
+        return None
+    bits, mask, moves, manhattan = tables.bits, tables.mask, tables.moves, tables.manhattan
+    update = heuristic.update if heuristic else None
+    lookup = _cache_lookup(cache, tables)
+    goal = tables.goal_code
+    found = -1
+    path = [encode_board(start_board)]    # Códigos del camino actual.
+    expanded = generated = deepest = 0
 
+    # Explora en profundidad; devuelve found o el menor f que superó la cota.
+    def search(code, blank, previous_blank, g, h, bound):
+        nonlocal expanded, generated, deepest
+        rest = lookup(code) if lookup is not None else None
+        if rest is not None:
+            f = g + len(rest) - 1
+            if f > bound:
+                return f
+            path.extend(rest[1:])
+            return found
+        f = g + h
+        if f > bound:
+            return f
+        if code == goal:
+            return found
+
+        expanded += 1
+        if g > deepest:
+            deepest = g
+        if not expanded % CHECK_INTERVAL:
+            checkpoint(stats, cancel, expanded, generated)
+        minimum = math.inf
+        blank_shift = blank * bits
+        for _, new_blank in moves[blank]:
+            if new_blank == previous_blank:
+                continue    # No deshace el movimiento anterior.
+            shift = new_blank * bits
+            tile = (code >> shift) & mask
+            child = code ^ (tile << shift) | (tile << blank_shift)
+            if update is None:
+                child_h = h + manhattan[tile][blank] - manhattan[tile][new_blank]
+            else:
+                child_h = update(h, child, tile, new_blank, blank)
+            generated += 1
+            path.append(child)
+            result = search(child, new_blank, blank, g + 1, child_h, bound)
+            if result == found:
+                return found
+            path.pop()
+            if result < minimum:
+                minimum = result
+        return minimum
+
+    start_h = heuristic.evaluate(start_board) if heuristic else manhattan_distance(start_board, tables)
+    bound = start_h
+    while True:
+        result = search(path[0], start_board.index(0), -1, 0, start_h, bound)
+        if result == found:
+            record_stats(stats, expanded, generated, peak_frontier=deepest + 1)
+            if cache is not None:
+                cache.store(path)
+            return path_from_codes(path, tables, labels)
+        if result == math.inf:
+            record_stats(stats, expanded, generated, peak_frontier=deepest + 1)
+            return None
+        bound = result
+
+# Pesos de la heurística de anytime_a_star, de la búsqueda más rápida a la óptima.
+ANYTIME_WEIGHTS = (5.0, 3.0, 2.0, 1.5, 1.25, 1.0)
+
+# A* ponderado anytime: busca con f = g + peso * h empezando por un peso alto, que encuentra pronto una primera
+# solución, y repite con pesos menores podando los nodos que ya no pueden mejorarla (g + h >= costo actual).
+# Se detiene al agotar los pesos o el presupuesto (time_limit en segundos, node_limit en nodos expandidos) y devuelve
+# la mejor solución hallada; el presupuesto no interrumpe la búsqueda de la primera. stats.bound recibe la cota
+# de suboptimalidad: la solución cuesta a lo más bound veces el óptimo.
+@instrumented
+def anytime_a_star(start_board, heuristic=None, weights=ANYTIME_WEIGHTS, time_limit=None, node_limit=None,
+                   stats=None, cancel=None, goal=None):
+    start_board, tables, labels = goal_frame(start_board, goal, heuristic)
+    if not is_solvable(start_board, tables.goal):
+        record_stats(stats, 0, 0)
+        return None
+    start = encode_board(start_board)
+    start_h = heuristic.evaluate(start_board) if heuristic else manhattan_distance(start_board, tables)
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    counters = [0, 0, 0, 0, 0]  # Expandidos, generados, duplicados, frontera máxima y best_cost máximo entre pasadas.
+    best = None     # Códigos de la mejor solución hallada.
+    lower = start_h     # Cota inferior del costo óptimo.
+
+    # Indica si se agotó el presupuesto (solo cuenta una vez hallada la primera solución).
+    def exhausted():
+        if best is None:
+            return False
+        return ((deadline is not None and time.perf_counter() >= deadline)
+                or (node_limit is not None and counters[0] >= node_limit))
+
+    for weight in weights:
+        if exhausted():
+            break
+        limit = math.inf if best is None else len(best) - 1
+        codes, pass_lower = _weighted_pass(start, start_board.index(0), start_h, weight, limit,
+                                           tables, heuristic, counters, exhausted, stats, cancel)
+        if codes is not None:
+            best = codes
+            pass_lower = max(pass_lower, (len(codes) - 1) / weight)   # Garantía del A* ponderado.
+        lower = max(lower, pass_lower)
+        if best is not None and lower >= len(best) - 1:
+            break   # Ya es óptima.
+
+    record_stats(stats, counters[0], counters[1], duplicates=counters[2], peak_frontier=counters[3],
+                 closed_size=counters[4], bound=(len(best) - 1) / lower if best and lower else 1.0)
+    return None if best is None else path_from_codes(best, tables, labels)
+
+# Una pasada de A* ponderado con peso weight; solo acepta soluciones de costo menor que limit.
+# Devuelve (códigos de la solución o None, cota inferior del costo óptimo). Si se agota el presupuesto, la cota es
+# el menor g + h de la frontera: con reaperturas, siempre queda en ella un nodo de un camino óptimo con su g óptimo.
+def _weighted_pass(start, start_blank, start_h, weight, limit, tables, heuristic, counters, exhausted, stats, cancel):
+    bits, mask, moves, manhattan = tables.bits, tables.mask, tables.moves, tables.manhattan
+    update = heuristic.update if heuristic else None
+    goal = tables.goal_code
+    frontier = [(weight * start_h, 0, start, start_blank, 0, start_h)]  # (f ponderado, contador, código, blanco, g, h).
+    best_cost = {start: 0}
+    parents = {start: None}
+
+    while frontier:
+        _, _, code, blank, g, h = heapq.heappop(frontier)
+        if g > best_cost[code]:
+            continue
+        if g + h >= limit:
+            continue    # No puede mejorar la solución que ya se tiene.
+        if code == goal:
+            return _rebuild_codes(parents, code), _frontier_bound(frontier, best_cost, g, limit)
+
+        counters[0] += 1
+        if not counters[0] % CHECK_INTERVAL:
+            checkpoint(stats, cancel, counters[0], counters[1])
+            if exhausted():
+                return None, _frontier_bound(frontier, best_cost, g + h, limit)
+        child_g = g + 1
+        blank_shift = blank * bits
+        for _, new_blank in moves[blank]:
+            shift = new_blank * bits
+            tile = (code >> shift) & mask
+            child = code ^ (tile << shift) | (tile << blank_shift)
+            if child_g < best_cost.get(child, child_g + 1):
+                best_cost[child] = child_g
+                parents[child] = code
+                counters[1] += 1
+                if update is None:
+                    child_h = h + manhattan[tile][blank] - manhattan[tile][new_blank]
+                else:
+                    child_h = update(h, child, tile, new_blank, blank)
+                heapq.heappush(frontier, (child_g + weight * child_h, counters[1], child, new_blank, child_g, child_h))
+            else:
+                counters[2] += 1
+        if len(frontier) > counters[3]:
+            counters[3] = len(frontier)
+        if len(best_cost) > counters[4]:
+            counters[4] = len(best_cost)
+
+    return None, limit  # Todo se podó: la solución actual es óptima (o no hay solución).
+
+# Menor g + h entre las entradas vigentes de la frontera de _weighted_pass, current (el nodo recién sacado) y limit.
+def _frontier_bound(frontier, best_cost, current, limit):
+    bound = min(current, limit)
+    for _, _, code, _, g, h in frontier:
+        if g <= best_cost[code] and g + h < bound:
+            bound = g + h
+    return bound
+
+# Búsqueda bidireccional en amplitud: avanza por capas desde el inicio y desde el objetivo,
+# expandiendo siempre la frontera más pequeña, hasta que ambas se encuentran en el medio.
+# Cada lado explora aproximadamente la raíz cuadrada de los nodos de un BFS unidireccional.
+@instrumented
+def bidirectional_search(start_board, stats=None, cancel=None, goal=None):
+    start_board, tables, labels = goal_frame(start_board, goal)
+    if not is_solvable(start_board, tables.goal):
+        record_stats(stats, 0, 0)
+        return None
+    start, goal = encode_board(start_board), tables.goal_code
+    if start == goal:
+        record_stats(stats, 0, 0)
+        return []
+
+    forward = {start: None}     # Código -> código anterior desde el inicio.
+    backward = {goal: None}     # Código -> código siguiente hacia el objetivo.
+    forward_layer = [(start, start_board.index(0))]
+    backward_layer = [(goal, tables.goal.index(0))]
+    counters = [0, 0, 0]  # Nodos expandidos, generados y duplicados entre ambos lados.
+    peak_frontier = 0
+
+    while forward_layer and backward_layer:
+        peak_frontier = max(peak_frontier, len(forward_layer) + len(backward_layer))
+        if len(forward_layer) <= len(backward_layer):
+            forward_layer, meeting = _expand_layer(forward_layer, forward, backward, tables, counters, stats, cancel)
+        else:
+            backward_layer, meeting = _expand_layer(backward_layer, backward, forward, tables, counters, stats, cancel)
+
+        if meeting is not None:
+            record_stats(stats, counters[0], counters[1], duplicates=counters[2],
+                         peak_frontier=peak_frontier, closed_size=len(forward) + len(backward))
+            codes = []
+            code = meeting
+            while code is not None:
+                codes.append(code)
+                code = forward[code]
+            codes.reverse()
+            code = backward[meeting]
+            while code is not None:
+                codes.append(code)
+                code = backward[code]
+            return path_from_codes(codes, tables, labels)
+
+    record_stats(stats, counters[0], counters[1], duplicates=counters[2],
+                 peak_frontier=peak_frontier, closed_size=len(forward) + len(backward))
     return None
 
+# Expande una capa completa de un lado de la búsqueda bidireccional.
+# Antes de expandir ambas mitades visitadas son disjuntas, así que el primer encuentro ya da un camino óptimo.
+def _expand_layer(layer, visited, other, tables, counters, stats, cancel):
+    bits, mask, moves = tables.bits, tables.mask, tables.moves
+    next_layer = []
+    for code, blank in layer:
+        counters[0] += 1
+        if not counters[0] % CHECK_INTERVAL:
+            checkpoint(stats, cancel, counters[0], counters[1])
+        blank_shift = blank * bits
+        for _, new_blank in moves[blank]:
+            shift = new_blank * bits
+            tile = (code >> shift) & mask
+            child = code ^ (tile << shift) | (tile << blank_shift)
+            if child in visited:
+                counters[2] += 1
+                continue
+            visited[child] = code
+            counters[1] += 1
+            if child in other:
+                return next_layer, child
+            next_layer.append((child, new_blank))
+    return next_layer, None
+
+# Solucionadores disponibles, seleccionables por nombre.
+SOLVERS = {"a_star": a_star, "ida_star": ida_star, "anytime": anytime_a_star, "bidirectional": bidirectional_search}
+
+# Resuelve un tablero con el método indicado ("a_star", "ida_star", "anytime" o "bidirectional"); options se pasan al solucionador.
+# La heurística también puede darse por nombre (heuristic="linear_conflict"; ver heuristics.HEURISTICS).
+def solve(board, method="a_star", **options):
+    if method not in SOLVERS:
+        raise ValueError(f"Método desconocido: {method}. Opciones: {', '.join(SOLVERS)}.")
+    if isinstance(options.get("heuristic"), str):
+        from heuristics import make_heuristic
+        options["heuristic"] = make_heuristic(options["heuristic"], board_width(board), options.get("goal"))
+    return SOLVERS[method](board, **options)
+
 # Reconstruye la ruta desde el estado objetivo hasta el inicial.
 def reconstruct_path(state):
     path = []
@@ -89,4 +972,25 @@ def reconstruct_path(state):
         path.append((state.move, state.board[:]))
         state = state.parent
     path.reverse()
+    return path
+
+# Reconstruye los códigos del camino (del inicial a code) a partir del diccionario de padres empaquetados.
+def _rebuild_codes(parents, code):
+    codes = []
+    while code is not None:
+        codes.append(code)
+        code = parents[code]
+    codes.reverse()
+    return codes
+
+# Convierte una secuencia de códigos (del inicial al objetivo) en la lista de (movimiento, tablero).
+# labels (de goal_frame) devuelve cada tablero del marco canónico a las fichas del objetivo original.
+def path_from_codes(codes, tables, labels=None):
+    path = []
+    previous = decode_board(codes[0], tables.cells)
+    for code in codes[1:]:
+        board = decode_board(code, tables.cells)
+        path.append((_move_name(board.index(0) - previous.index(0), tables.width),
+                     board if labels is None else [labels[tile] for tile in board]))
+        previous = board
     return path
\ No newline at end of file
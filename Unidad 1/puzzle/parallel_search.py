@@ -0,0 +1,258 @@
+# A* distribuido por hash (HDA*) entre varios procesos, para instancias difíciles del puzzle 15 o mayores.
+# Autor: Espinoza Felix Fausto Gabriel.
+# Fecha: 2026-10-18.
+#
+# Uso: py parallel_search.py 7 8 12 2 6 11 14 5 10 4 0 1 9 13 15 3 --workers 8 --heuristic walking_distance
+#
+# Cada estado tiene un proceso dueño, elegido por un hash Zobrist del tablero empaquetado. Solo el dueño guarda su
+# best_cost y su padre, así la memoria y el trabajo se reparten entre todos los núcleos. Al expandir un nodo, los
+# hijos de otros dueños se les envían por colas, en lotes. La primera solución fija una cota (incumbent); la búsqueda
+# termina cuando ningún proceso tiene nodos con f menor que ella y no quedan mensajes en camino: entonces es óptima.
+import argparse
+import heapq
+import math
+import multiprocessing
+import queue
+import random
+import time
+
+from model import (SolverStats, board_width, checkpoint, decode_board, encode_board, get_tables, goal_frame,
+                   instrumented, is_solvable, manhattan_distance, path_from_codes, record_stats)
+
+EXPAND_BATCH = 64       # Nodos que expande un proceso entre dos revisiones de su cola.
+POLL_INTERVAL = 0.005   # Cada cuántos segundos revisa el proceso principal si ya terminó (o se canceló).
+
+# Tabla Zobrist de un tamaño de tablero: un número aleatorio fijo por (ficha, posición), igual en todos los procesos.
+# El hash de un tablero es el XOR de los de sus fichas y se actualiza en O(1) al mover una ficha.
+def _zobrist_table(tables):
+    rng = random.Random(tables.width)
+    return [[rng.getrandbits(32) for _ in range(tables.cells)] for _ in range(tables.cells)]
+
+def _zobrist_key(code, tables, zobrist):
+    key = 0
+    for pos, tile in enumerate(decode_board(code, tables.cells)):
+        key ^= zobrist[tile][pos]
+    return key
+
+# Proceso trabajador: A* sobre los estados de los que es dueño.
+# Mensajes de su cola: ("nodes", [(código, blanco, g, h, hash, padre), ...]), ("trace", código) pide el padre
+# de un estado para reconstruir el camino y ("stop", None) devuelve sus contadores y termina.
+# inflight cuenta los lotes enviados y aún no procesados; idle[me] indica que el proceso no tiene nada que hacer.
+# Ambos se cambian con lock: consumir un lote baja inflight y marca al proceso ocupado en un solo paso, así el
+# proceso principal nunca ve "todos inactivos y nada en camino" mientras queda trabajo pendiente.
+def _search_worker(me, inboxes, results, lock, inflight, idle, incumbent, progress, width, goal_blank, heuristic):
+    tables = get_tables(width, goal_blank)
+    bits, mask, moves, manhattan, goal = tables.bits, tables.mask, tables.moves, tables.manhattan, tables.goal_code
+    zobrist = _zobrist_table(tables)
+    update = heuristic.update if heuristic else None
+    workers = len(inboxes)
+    inbox = inboxes[me]
+    frontier = []       # (f, contador, código, blanco, g, hash).
+    best_cost = {}
+    parents = {}
+    outbox = [[] for _ in range(workers)]
+    counter = expanded = duplicates = peak_frontier = 0
+
+    # Agrega a la frontera los nodos recibidos que mejoran el mejor costo conocido.
+    def receive(nodes):
+        nonlocal counter, duplicates
+        for code, blank, g, h, key, parent in nodes:
+            if g < best_cost.get(code, g + 1):
+                best_cost[code] = g
+                parents[code] = parent
+                counter += 1
+                heapq.heappush(frontier, (g + h, counter, code, blank, g, key))
+            else:
+                duplicates += 1
+
+    while True:
+        message = None
+        if frontier and frontier[0][0] < incumbent.value:
+            try:
+                message = inbox.get_nowait()
+            except queue.Empty:
+                pass
+        else:
+            if not idle[me]:
+                with lock:
+                    idle[me] = 1
+            message = inbox.get()
+
+        if message is not None:
+            kind, payload = message
+            if kind == "nodes":
+                with lock:
+                    inflight.value -= 1
+                    idle[me] = 0
+                receive(payload)
+            elif kind == "trace":
+                results.put(("parent", payload, parents.get(payload)))
+            else:
+                results.put(("stats", me, (expanded, counter, duplicates, peak_frontier, len(best_cost))))
+                return
+            continue
+
+        for _ in range(EXPAND_BATCH):
+            if not frontier or frontier[0][0] >= incumbent.value:
+                break   # Lo que queda no puede mejorar la solución ya encontrada.
+            f, _, code, blank, g, key = heapq.heappop(frontier)
+            if g > best_cost[code]:
+                continue    # Entrada obsoleta: ya se encontró un camino más corto a este estado.
+            if code == goal:
+                with lock:
+                    if g < incumbent.value:
+                        incumbent.value = g
+                continue
+
+            expanded += 1
+            h = f - g
+            child_g = g + 1
+            blank_shift = blank * bits
+            for _, new_blank in moves[blank]:
+                shift = new_blank * bits
+                tile = (code >> shift) & mask
+                child = code ^ (tile << shift) | (tile << blank_shift)   # Desliza la ficha hacia el blanco.
+                if update is None:
+                    child_h = h + manhattan[tile][blank] - manhattan[tile][new_blank]   # Solo cambia la ficha movida.
+                else:
+                    child_h = update(h, child, tile, new_blank, blank)
+                if child_g + child_h >= incumbent.value:
+                    continue
+                child_key = (key ^ zobrist[tile][new_blank] ^ zobrist[tile][blank]
+                             ^ zobrist[0][blank] ^ zobrist[0][new_blank])
+                node = (child, new_blank, child_g, child_h, child_key, code)
+                owner = child_key % workers
+                if owner == me:
+                    receive((node,))
+                else:
+                    outbox[owner].append(node)
+
+        for owner, nodes in enumerate(outbox):
+            if nodes:
+                with lock:
+                    inflight.value += 1     # Antes de enviar: el lote cuenta como pendiente desde ya.
+                inboxes[owner].put(("nodes", nodes))
+                outbox[owner] = []
+        if len(frontier) > peak_frontier:
+            peak_frontier = len(frontier)
+        progress[2 * me] = expanded
+        progress[2 * me + 1] = counter
+
+# Revisa que los procesos trabajadores sigan vivos: uno que termina antes de recibir "stop" (por una excepción o
+# porque el sistema lo mató por falta de memoria) nunca marcará su idle ni procesará sus lotes, así que la búsqueda
+# no terminaría. Con stopped, ya se pidió que terminen y solo cuenta como error una salida con código distinto de 0.
+def _check_workers(processes, stopped=False):
+    for process in processes:
+        if process.exitcode is not None and (process.exitcode or not stopped):
+            raise RuntimeError(f"Un proceso trabajador terminó inesperadamente (código {process.exitcode}).")
+
+# Espera el siguiente mensaje de los trabajadores revisando entre tanto que sigan vivos.
+def _receive(results, processes, stopped=False):
+    while True:
+        try:
+            return results.get(timeout=POLL_INTERVAL)
+        except queue.Empty:
+            _check_workers(processes, stopped)
+            if stopped and all(process.exitcode is not None for process in processes):
+                raise RuntimeError("Los procesos trabajadores terminaron sin enviar sus resultados.")
+
+# A* distribuido por hash: devuelve un camino óptimo con el mismo formato que a_star.
+# heuristic y goal funcionan como en a_star (la heurística se copia a cada proceso; una PDB se vuelve a mapear allí).
+# workers es el número de procesos (por defecto, uno por núcleo). Solo conviene en instancias difíciles: crear los
+# procesos y enviar los nodos cuesta más que resolver un puzzle 8 con a_star. No se puede llamar desde un proceso
+# daemon (p. ej. un trabajador de multiprocessing.Pool), porque necesita crear procesos propios.
+# stats suma los contadores de todos los procesos; con track_memory, el pico de memoria es solo el del proceso principal.
+@instrumented
+def hda_star(start_board, heuristic=None, workers=None, stats=None, cancel=None, goal=None):
+    start_board, tables, labels = goal_frame(start_board, goal, heuristic)
+    if not is_solvable(start_board, tables.goal):
+        record_stats(stats, 0, 0)
+        return None
+    start = encode_board(start_board)
+    if start == tables.goal_code:
+        record_stats(stats, 0, 0)
+        return []
+    workers = workers or multiprocessing.cpu_count()
+    if workers < 1:
+        raise ValueError("Se necesita al menos un proceso trabajador.")
+
+    zobrist = _zobrist_table(tables)
+    start_h = heuristic.evaluate(start_board) if heuristic else manhattan_distance(start_board, tables)
+    start_key = _zobrist_key(start, tables, zobrist)
+    inboxes = [multiprocessing.Queue() for _ in range(workers)]
+    results = multiprocessing.Queue()
+    lock = multiprocessing.Lock()
+    inflight = multiprocessing.RawValue("i", 1)     # El lote inicial ya está en camino.
+    idle = multiprocessing.RawArray("b", workers)
+    incumbent = multiprocessing.RawValue("d", math.inf)    # Costo de la mejor solución hallada.
+    progress = multiprocessing.RawArray("q", 2 * workers)   # Expandidos y generados de cada proceso.
+    inboxes[start_key % workers].put(("nodes", [(start, start_board.index(0), 0, start_h, start_key, None)]))
+
+    processes = [multiprocessing.Process(target=_search_worker, daemon=True,
+                                         args=(me, inboxes, results, lock, inflight, idle, incumbent, progress,
+                                               tables.width, tables.goal_blank, heuristic))
+                 for me in range(workers)]
+    for process in processes:
+        process.start()
+    try:
+        while True:
+            with lock:
+                done = not inflight.value and all(idle)
+            if done:
+                break
+            _check_workers(processes)
+            time.sleep(POLL_INTERVAL)
+            checkpoint(stats, cancel, sum(progress[0::2]), sum(progress[1::2]))
+
+        codes = None
+        if incumbent.value < math.inf:
+            # Cada padre lo guarda el dueño de su hijo: se piden uno a uno desde el objetivo.
+            codes = [tables.goal_code]
+            while True:
+                inboxes[_zobrist_key(codes[-1], tables, zobrist) % workers].put(("trace", codes[-1]))
+                _, _, parent = _receive(results, processes)
+                if parent is None:
+                    break
+                codes.append(parent)
+            codes.reverse()
+
+        for inbox in inboxes:
+            inbox.put(("stop", None))
+        totals = [0, 0, 0, 0, 0]    # Expandidos, generados, duplicados, frontera máxima y best_cost.
+        for _ in range(workers):
+            _, _, counters = _receive(results, processes, stopped=True)
+            totals = [total + value for total, value in zip(totals, counters)]
+        for process in processes:
+            process.join()
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()     # Cancelación o error: los trabajadores no tienen nada que guardar.
+
+    record_stats(stats, totals[0], totals[1], duplicates=totals[2], peak_frontier=totals[3], closed_size=totals[4])
+    return None if codes is None else path_from_codes(codes, tables, labels)
+
+# Resuelve un tablero desde consola e imprime los movimientos y las estadísticas.
+def main():
+    from heuristics import HEURISTICS, make_heuristic
+
+    parser = argparse.ArgumentParser(description="Resuelve un tablero con A* distribuido en varios procesos (HDA*).")
+    parser.add_argument("board", nargs="+", help="Valores del tablero (0 es el blanco), separados por espacios o comas.")
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count(), help="Procesos en paralelo.")
+    parser.add_argument("--heuristic", choices=sorted(HEURISTICS), default="manhattan", help="Heurística de la búsqueda.")
+    parser.add_argument("--goal", help="Objetivo propio, con el mismo formato que el tablero.")
+    args = parser.parse_args()
+
+    board = [int(value) for value in " ".join(args.board).replace(",", " ").split()]
+    goal = [int(value) for value in args.goal.replace(",", " ").split()] if args.goal else None
+    heuristic = None if args.heuristic == "manhattan" else make_heuristic(args.heuristic, board_width(board), goal)
+    stats = SolverStats()
+    path = hda_star(board, heuristic=heuristic, workers=args.workers, stats=stats, goal=goal)
+    if path is None:
+        print("El tablero no tiene solución.")
+    else:
+        print(f"{len(path)} movimientos: {' '.join(move for move, _ in path)}")
+    print(stats.summary())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+# Bases de datos de patrones (PDB) aditivas para el puzzle N x N, guardadas en disco y mapeadas en memoria.
+# Autor: Espinoza Felix Fausto Gabriel.
+# Fecha: 2026-10-18.
+import argparse
+import mmap
+import os
+import time
+from array import array
+
+from model import get_tables
+
+# Carpeta donde se guardan las tablas generadas.
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+# Particiones disjuntas por defecto de las fichas según el ancho del tablero.
+DEFAULT_PATTERNS = {
+    3: ((1, 2, 3, 4), (5, 6, 7, 8)),
+    4: ((1, 2, 3, 5, 6), (4, 7, 8, 11, 12), (9, 10, 13, 14, 15)),
+}
+
+UNKNOWN = 255   # Valor de las combinaciones de posiciones que no se alcanzan (casillas repetidas).
+
+# Ruta del archivo de un patrón (con el blanco del objetivo fuera de la última casilla, lleva el sufijo _b<casilla>).
+def pattern_path(width, tiles, directory=DATA_DIR, goal_blank=None):
+    name = "-".join(str(tile) for tile in tiles)
+    suffix = "" if goal_blank in (None, width * width - 1) else f"_b{goal_blank}"
+    return os.path.join(directory, f"pdb_{width}x{width}_{name}{suffix}.bin")
+
+# Indica si ya están generadas en directory las PDB de los patrones por defecto de un ancho
+# (así se puede elegir la PDB sin esperar a construirla).
+def default_patterns_ready(width, directory=DATA_DIR, goal_blank=None):
+    if width not in DEFAULT_PATTERNS:
+        return False
+    return all(os.path.exists(pattern_path(width, tiles, directory, goal_blank)) for tiles in DEFAULT_PATTERNS[width])
+
+# Genera la PDB de un patrón por BFS hacia atrás desde el objetivo.
+# El estado es (posiciones de las fichas del patrón, blanco) y solo cuestan los movimientos de fichas del patrón;
+# así las PDB de patrones disjuntos se pueden sumar sin sobreestimar (heurística aditiva).
+# El índice de un patrón es posición[0] * cells^(k-1) + ... + posición[k-1], un byte por entrada.
+# goal_blank elige el objetivo canónico (por defecto, el blanco en la última casilla).
+def build_pattern(width, tiles, goal_blank=None):
+    tables = get_tables(width, goal_blank)
+    cells, moves, goal = tables.cells, tables.moves, tables.goal
+    k = len(tiles)
+    weights = [cells ** (k - 1 - j) for j in range(k)]
+    pdb = bytearray([UNKNOWN]) * (cells ** k)
+    settled = bytearray(cells ** (k + 1))   # Estados (índice * cells + blanco) ya cerrados.
+
+    start = sum(goal.index(tile) * weight for tile, weight in zip(tiles, weights))
+    layer = array("I", [start * cells + goal.index(0)])
+    depth = 0
+
+    while layer:
+        next_layer = array("I")
+        i = 0
+        while i < len(layer):     # La capa crece con los movimientos de costo 0 del blanco.
+            state = layer[i]
+            i += 1
+            if settled[state]:
+                continue
+            settled[state] = 1
+            index, blank = divmod(state, cells)
+            if pdb[index] == UNKNOWN:
+                pdb[index] = depth
+
+            occupied = {}     # Posición -> peso de la ficha del patrón que la ocupa.
+            rest = index
+            for j in range(k - 1, -1, -1):
+                rest, pos = divmod(rest, cells)
+                occupied[pos] = weights[j]
+
+            for _, new_blank in moves[blank]:
+                weight = occupied.get(new_blank)
+                if weight is None:
+                    child = state + new_blank - blank     # Solo se mueve el blanco: costo 0.
+                    if not settled[child]:
+                        layer.append(child)
+                else:
+                    child = state + (blank - new_blank) * weight * cells + new_blank - blank   # Se mueve una ficha del patrón.
+                    if not settled[child]:
+                        next_layer.append(child)
+        layer = next_layer
+        depth += 1
+
+    return pdb
+
+# Guarda una tabla en disco de forma atómica (otro proceso nunca ve un archivo a medias).
+def save_pattern(path, pdb):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as file:
+        file.write(pdb)
+    os.replace(temp_path, path)
+
+# Heurística de patrones disjuntos: suma de las PDB de cada patrón.
+# Las tablas se abren con mmap de solo lectura, así varios procesos solucionadores comparten las mismas páginas.
+# Implementa la interfaz de heurística de model.py (evaluate / update).
+# Con goal, las tablas son las del objetivo canónico con el mismo blanco: sirven para todos los objetivos así.
+class PatternDatabase:
+
+    def __init__(self, width, patterns=None, directory=DATA_DIR, goal=None):
+        if patterns is None and width not in DEFAULT_PATTERNS:
+            raise ValueError(f"No hay patrones por defecto para {width}x{width}; indique patterns. "
+                             f"Anchos con patrones: {', '.join(str(w) for w in DEFAULT_PATTERNS)}.")
+        self.width = width
+        self.patterns = tuple(tuple(tiles) for tiles in (patterns or DEFAULT_PATTERNS[width]))
+        self.directory = directory
+        self.goal_blank = get_tables(width, None if goal is None else goal.index(0)).goal_blank
+        self._open()
+
+    # Valida los patrones, genera los que falten y mapea los archivos en memoria.
+    def _open(self):
+        tables = get_tables(self.width, self.goal_blank)
+        cells = tables.cells
+        self._cells, self._bits, self._mask = cells, tables.bits, tables.mask
+        self._group = [-1] * cells    # Ficha -> número de patrón (-1 si no pertenece a ninguno).
+        self._weight = [0] * cells    # Ficha -> peso de su posición en el índice del patrón.
+        self._maps = []
+
+        for group, tiles in enumerate(self.patterns):
+            for j, tile in enumerate(tiles):
+                if not 0 < tile < cells:
+                    raise ValueError(f"Ficha fuera de rango para un tablero {self.width}x{self.width}: {tile}.")
+                if self._group[tile] != -1:
+                    raise ValueError(f"Los patrones deben ser disjuntos; la ficha {tile} se repite.")
+                self._group[tile] = group
+                self._weight[tile] = cells ** (len(tiles) - 1 - j)
+
+            path = pattern_path(self.width, tiles, self.directory, self.goal_blank)
+            if not os.path.exists(path):
+                save_pattern(path, build_pattern(self.width, tiles, self.goal_blank))
+            with open(path, "rb") as file:
+                self._maps.append(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+    # Calcula la heurística completa de un tablero.
+    def evaluate(self, board):
+        indices = [0] * len(self.patterns)
+        for pos, tile in enumerate(board):
+            group = self._group[tile]
+            if group >= 0:
+                indices[group] += pos * self._weight[tile]
+        return sum(table[index] for table, index in zip(self._maps, indices))
+
+    # Actualiza h tras mover tile de src a dst: solo cambia el término del patrón de esa ficha.
+    def update(self, h, code, tile, src, dst):
+        group = self._group[tile]
+        if group < 0:
+            return h
+        bits, mask, members, weights = self._bits, self._mask, self._group, self._weight
+        index = 0
+        for pos in range(self._cells):
+            other = (code >> (pos * bits)) & mask
+            if members[other] == group:
+                index += pos * weights[other]
+        table = self._maps[group]
+        return h - table[index - (dst - src) * weights[tile]] + table[index]
+
+    # Libera los mapas de memoria.
+    def close(self):
+        for table in self._maps:
+            table.close()
+        self._maps = []
+
+    # Al enviarse a otro proceso solo viajan los parámetros; las tablas se vuelven a mapear allí.
+    def __getstate__(self):
+        return {"width": self.width, "patterns": self.patterns, "directory": self.directory,
+                "goal_blank": self.goal_blank}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._open()
+
+# Genera desde consola las PDB de un ancho de tablero (py pattern_db.py 4).
+def main():
+    parser = argparse.ArgumentParser(description="Genera las bases de datos de patrones del puzzle.")
+    parser.add_argument("width", type=int, nargs="?", default=3, help="Ancho del tablero (3 o 4).")
+    parser.add_argument("--force", action="store_true", help="Regenera las tablas aunque ya existan.")
+    args = parser.parse_args()
+
+    for tiles in DEFAULT_PATTERNS[args.width]:
+        path = pattern_path(args.width, tiles)
+        if os.path.exists(path) and not args.force:
+            print(f"{path}: ya existe.")
+            continue
+        started = time.perf_counter()
+        save_pattern(path, build_pattern(args.width, tiles))
+        print(f"{path}: {os.path.getsize(path)} bytes en {time.perf_counter() - started:.1f} s.")
+
+if __name__ == "__main__":
+    main()
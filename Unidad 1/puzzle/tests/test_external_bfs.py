@@ -0,0 +1,38 @@
+# Pruebas del BFS en memoria externa con bloques diminutos, que generan cientos de corridas por capa.
+# El resultado debe ser idéntico a la tabla construida en memoria y no debe agotar los archivos abiertos.
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from external_bfs import external_bfs
+from lookup_table import build_table
+
+
+def _read(path):
+    with open(path, "rb") as file:
+        return file.read()
+
+
+# Con chunk_size=1 cada tablero de la capa es una corrida; fan_in=2 obliga a varias pasadas de mezcla.
+def test_tiny_chunks_match_build_table(tmp_path):
+    path, histogram = external_bfs(2, str(tmp_path), chunk_size=1, fan_in=2)
+    assert _read(path) == bytes(build_table(2))
+    assert sum(histogram.values()) == 12
+
+
+# Con chunk_size=20 una capa del puzzle 8 produce más de mil corridas: con un límite de 64 archivos abiertos,
+# solo termina si las corridas se mezclan por grupos.
+def test_many_runs_stay_under_open_file_limit(tmp_path):
+    resource = pytest.importorskip("resource")
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (min(64, hard), hard))
+    try:
+        path, histogram = external_bfs(3, str(tmp_path), chunk_size=20, fan_in=16)
+    finally:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
+    assert _read(path) == bytes(build_table(3))
+    assert max(histogram) == 31
+    assert sorted(os.listdir(tmp_path)) == [os.path.basename(path), "table_3x3_histogram.json"]   # Sin corridas sueltas.
@@ -6,14 +6,17 @@ import tkinter as tk
 # Constantes de estilo.
 FONT_FAMILY = "Segoe UI"
 SOLVE_BUTTON_TEXT = "Resolver Puzzle"
+CANCEL_BUTTON_TEXT = "Cancelar"
 
 class PuzzleView:
     
-    # Inicializa la vista principal del puzzle con la ventana raíz y el controlador opcional.
-    def __init__(self, root, controller=None):
+    # Inicializa la vista principal del puzzle con la ventana raíz, el controlador opcional y el tamaño del tablero.
+    def __init__(self, root, controller=None, size=3):
         self.controller = controller
         self.root = root
-        self.root.title("Puzzle 8 - Algoritmo A*")
+        self.size = size
+        self.title = f"Puzzle {size * size - 1}"
+        self.root.title(f"{self.title} - Algoritmo A*")
         self.root.configure(bg='#f0f0f0')
         self.root.geometry("450x550")
         self.root.minsize(400, 500)
@@ -33,7 +36,7 @@ class PuzzleView:
         # Título del puzzle.
         title_label = tk.Label(
             self.root,
-            text="Puzzle 8",
+            text=self.title,
             font=(FONT_FAMILY, 24, "bold"),
             bg='#f0f0f0',
             fg='#2c3e50'
@@ -44,13 +47,13 @@ class PuzzleView:
         self.main_frame = tk.Frame(self.root, bg='#f0f0f0')
         self.main_frame.grid(row=1, column=0, padx=20, pady=10, sticky="nsew")
         
-        # Configuración del grid interno del tablero (3x3).
-        for i in range(3):
+        # Configuración del grid interno del tablero (size x size).
+        for i in range(self.size):
             self.main_frame.grid_rowconfigure(i, weight=1, uniform="row")
             self.main_frame.grid_columnconfigure(i, weight=1, uniform="col")
 
-        # Creación de los 9 botones del tablero.
-        for i in range(9):
+        # Creación de los botones del tablero.
+        for i in range(self.size * self.size):
             btn = tk.Button(
                 self.main_frame,
                 text="",
@@ -65,8 +68,8 @@ class PuzzleView:
                 activeforeground='white'
             )
             btn.grid(
-                row=i // 3, 
-                column=i % 3, 
+                row=i // self.size, 
+                column=i % self.size, 
                 padx=3, 
                 pady=3, 
                 sticky="nsew"
@@ -146,6 +149,17 @@ class PuzzleView:
         )
         self.moves_label.grid(row=2, column=0, columnspan=2, pady=(10, 0))
 
+        # Estadísticas de la última búsqueda automática.
+        self.stats_label = tk.Label(
+            controls_frame,
+            text="",
+            font=(FONT_FAMILY, 9),
+            bg='#f0f0f0',
+            fg='#95a5a6',
+            wraplength=350
+        )
+        self.stats_label.grid(row=3, column=0, columnspan=2, pady=(5, 0))
+
     # Efecto visual al pasar el cursor sobre una ficha (si no está vacía).
     def _on_hover_enter(self, button):
         if button['text']:  # Solo si no es el espacio vacío.
@@ -161,7 +175,8 @@ class PuzzleView:
     
     def _on_solve_hover_leave(self, _event):
         if self.solve_btn['state'] != 'disabled':
-            self.solve_btn.configure(bg='#e74c3c')
+            solving = self.controller and self.controller.is_solving()
+            self.solve_btn.configure(bg='#95a5a6' if solving else '#e74c3c')
     
     def _on_restart_hover_enter(self, _event):
         if self.restart_btn['state'] != 'disabled':
@@ -180,15 +195,18 @@ class PuzzleView:
         if self.controller:
             self.controller.move_tile(index)
 
-    # Callback para iniciar la resolución automática del puzzle.
+    # Callback del botón resolver: inicia la resolución automática o la cancela si ya está en curso.
     def _on_solve_click(self):
         if self.controller:
+            if self.controller.is_solving():
+                self.controller.stop_solving()
+                self.on_solve_cancelled()
+                return
             self.solve_btn.config(
-                state=tk.DISABLED,
-                text="Resolviendo...",
+                text=CANCEL_BUTTON_TEXT,
                 bg='#95a5a6'
             )
-            self.status_label.config(text="Ejecutando algoritmo A*...")
+            self.status_label.config(text="Buscando solución...")
             self.controller.solve_puzzle()
     
     # Callback para reiniciar el puzzle manualmente.
@@ -229,6 +247,23 @@ class PuzzleView:
                     cursor="hand2"
                 )
     
+    # Muestra el progreso de la búsqueda en segundo plano.
+    def update_progress(self, expanded):
+        self.status_label.config(text=f"Buscando solución... {expanded:,} nodos expandidos")
+
+    # Muestra las estadísticas de la búsqueda (nodos, frontera, tiempo) bajo el contador.
+    def show_stats(self, stats):
+        self.stats_label.config(text=stats.summary() if stats else "")
+
+    # Callback al cancelar la resolución automática.
+    def on_solve_cancelled(self):
+        self.solve_btn.config(
+            state=tk.NORMAL,
+            text=SOLVE_BUTTON_TEXT,
+            bg='#e74c3c'
+        )
+        self.status_label.config(text="Resolución cancelada.")
+
     # Actualiza el contador de movimientos en pantalla.
     def update_moves_counter(self, moves):
         self.moves_label.config(text=f"Movimientos: {moves}")